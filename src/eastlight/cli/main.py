@@ -2,52 +2,129 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
 from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
 
 import click
-from rich.console import Console
-from rich.table import Table
-
-import yaml
-
-from eastlight.core.config import detect_device, load_config, resolve_roland_dir, save_config
-from eastlight.core.library import RC505Library
-from eastlight.core.model import Memory
-from eastlight.core.parser import parse_memory_file
-from eastlight.core.schema import SchemaRegistry
-from eastlight.core.wav import (
-    DEVICE_SAMPLE_RATE,
-    ExportFormat,
-    import_audio,
-    wav_export,
-    wav_info,
-    wav_write_device,
-)
-from eastlight.core.writer import write_rc0
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from eastlight.core.library import MemorySummary, RC505Library
+    from eastlight.core.model import Memory
+    from eastlight.core.parser import RC0File
+    from eastlight.core.schema import SchemaRegistry
+
 
+@functools.lru_cache(maxsize=1)
+def _console() -> Console:
+    """Return the shared Rich console, importing Rich on first use."""
+    from rich.console import Console
 
+    return Console()
+
+
+@functools.lru_cache(maxsize=1)
 def _load_registry() -> SchemaRegistry:
-    """Load the built-in schema registry."""
-    registry = SchemaRegistry()
-    registry.load_all()
-    return registry
+    """Load the built-in schema registry (once per process, disk-cached)."""
+    from eastlight.core.schema import load_cached_registry
+
+    return load_cached_registry()
+
+
+@functools.lru_cache(maxsize=4)
+def _library(roland_dir: str) -> RC505Library:
+    """Return the RC505Library for a resolved ROLAND directory.
+
+    One instance per directory is shared by all commands in the process,
+    so batch and repl sessions keep its per-slot name cache warm.
+    """
+    from eastlight.core.library import RC505Library
+
+    return RC505Library(roland_dir)
 
 
+@functools.lru_cache(maxsize=4)
 def _resolve_dir(roland_dir: str | None) -> str:
-    """Resolve ROLAND directory, raising ClickException on failure."""
+    """Resolve ROLAND directory, raising ClickException on failure.
+
+    Successful results are kept for the process lifetime (batch and repl
+    run many commands); ``config --set-dir`` clears them.
+    """
+    from eastlight.core.config import resolve_roland_dir
+
     try:
         return str(resolve_roland_dir(roland_dir))
     except ValueError as e:
         raise click.ClickException(str(e))
 
 
-def _open_memory(roland_dir: str, memory_num: int) -> tuple[RC505Library, Memory, SchemaRegistry]:
-    """Parse a memory and return (library, memory, registry) for reuse."""
-    lib = RC505Library(roland_dir)
-    registry = _load_registry()
+# Parsed memories shared by read-only commands in this process:
+# path → ((inode, mtime_ns, size), RC0File), oldest first
+_MEMORY_CACHE: dict[str, tuple[tuple[int, int, int], RC0File]] = {}
+_MEMORY_CACHE_SIZE = 8
+
+
+def _memory_cache_put(lib: RC505Library, memory_num: int, rc0: RC0File) -> None:
+    """Store ``rc0`` as the parse of the memory file as it is on disk now."""
+    path = lib.data_dir / f"MEMORY{memory_num:03d}A.RC0"
+    st = path.stat()
+    key = str(path)
+    _MEMORY_CACHE.pop(key, None)
+    _MEMORY_CACHE[key] = ((st.st_ino, st.st_mtime_ns, st.st_size), rc0)
+    while len(_MEMORY_CACHE) > _MEMORY_CACHE_SIZE:
+        del _MEMORY_CACHE[next(iter(_MEMORY_CACHE))]
+
+
+def _read_memory(lib: RC505Library, memory_num: int) -> RC0File:
+    """Parse a memory for display, reusing an earlier parse of the same file.
+
+    The result is shared across commands in this process (e.g. 'batch'
+    lines), so callers must not modify it. The stat signature only guards
+    against changes made outside this process: copy2 restores an old mtime
+    in place and FAT has 2 s mtimes, so every command that writes memories
+    must also call _remember_saved or _forget_memories.
+    """
+    path = lib.data_dir / f"MEMORY{memory_num:03d}A.RC0"
+    st = path.stat()
+    cached = _MEMORY_CACHE.get(str(path))
+    if cached is not None and cached[0] == (st.st_ino, st.st_mtime_ns, st.st_size):
+        return cached[1]
     rc0 = lib.parse_memory(memory_num)
+    _memory_cache_put(lib, memory_num, rc0)
+    return rc0
+
+
+def _remember_saved(lib: RC505Library, memory_num: int, rc0: RC0File) -> None:
+    """Write-through: cache a memory this command just saved, as saved.
+
+    The writer round-trips exactly, so a following read-only command
+    (the next 'batch' line, say) can use ``rc0`` instead of re-parsing
+    the file. Call only once the command has finished modifying it.
+    """
+    _memory_cache_put(lib, memory_num, rc0)
+
+
+def _forget_memories(lib: RC505Library, *memory_nums: int) -> None:
+    """Drop cached parses of memories this command rewrote or removed."""
+    for memory_num in memory_nums:
+        _MEMORY_CACHE.pop(str(lib.data_dir / f"MEMORY{memory_num:03d}A.RC0"), None)
+
+
+def _open_memory(
+    roland_dir: str, memory_num: int, *, readonly: bool = False
+) -> tuple[RC505Library, Memory, SchemaRegistry]:
+    """Parse a memory and return (library, memory, registry) for reuse.
+
+    With ``readonly=True`` the parse may be shared (see _read_memory).
+    """
+    from eastlight.core.model import Memory
+
+    lib = _library(roland_dir)
+    registry = _load_registry()
+    rc0 = _read_memory(lib, memory_num) if readonly else lib.parse_memory(memory_num)
     return lib, Memory(rc0, registry), registry
 
 
@@ -58,6 +135,7 @@ def _validate_warn(schema, tag: str, value: int) -> None:
     fd = schema.fields.get(tag)
     if fd is None:
         return
+    console = _console()
     if fd.choices and value not in fd.choices:
         valid = ", ".join(f"{k}={v}" for k, v in fd.choices.items())
         console.print(
@@ -78,21 +156,110 @@ def _validate_warn(schema, tag: str, value: int) -> None:
             )
 
 
+def _param_row(tag: str, value: int, fields: dict | None) -> tuple[str, str, str, str]:
+    """Format one (Tag, Parameter, Value, Display) row for a parameter table.
+
+    ``fields`` is the schema's tag → FieldDef dict, or None to show raw tags.
+    """
+    fd = fields.get(tag) if fields is not None else None
+    if fd is None:
+        return tag, tag, str(value), str(value)
+    choice = fd.choices.get(value) if fd.choices else None
+    if choice is not None:
+        display_val = choice
+    elif fd.unit:
+        display_val = f"{value} {fd.unit}"
+    else:
+        display_val = str(value)
+    return tag, fd.display or fd.name, str(value), display_val
+
+
+_json_option = click.option(
+    "--json", "as_json", is_flag=True, help="Print JSON to stdout instead of a table"
+)
+
+
+def _echo_json(data: object) -> None:
+    """Write ``data`` as JSON to stdout, bypassing Rich entirely."""
+    import json
+
+    click.echo(json.dumps(data, ensure_ascii=False))
+
+
 @click.group()
 @click.version_option(package_name="eastlight")
 def cli() -> None:
     """EastLight — RC-505 MK2 editor/librarian."""
 
 
+# Rendered "1 2 3 4 5" track column for every combination of has-audio flags
+_TRACK_INDICATORS = {
+    flags: " ".join(
+        f"[green]{t}[/green]" if has_audio else f"[dim]{t}[/dim]"
+        for t, has_audio in enumerate(flags, 1)
+    )
+    for flags in itertools.product((False, True), repeat=5)
+}
+# Same, as ANSI-styled text for the plain renderer
+_PLAIN_TRACK_INDICATORS = {
+    flags: " ".join(
+        click.style(str(t), fg="green") if has_audio else click.style(str(t), dim=True)
+        for t, has_audio in enumerate(flags, 1)
+    )
+    for flags in _TRACK_INDICATORS
+}
+# Backup column, indexed by has_backup
+_BACKUP_INDICATORS = ("[red]N[/red]", "[green]Y[/green]")
+_PLAIN_BACKUP_INDICATORS = (click.style("N", fg="red"), click.style("Y", fg="green"))
+
+
+def _echo_memory_list_plain(summaries: list[MemorySummary]) -> None:
+    """Print the memory list as fixed-width text in one write, without Rich."""
+    lines = [click.style(f"{'#':>4}  {'Name':<14}  {'Tracks':<9}  {'Tempo':>6}  Backup", bold=True)]
+    for summary in summaries:
+        tempo_str = f"{summary.tempo_x10 / 10:.1f}" if summary.tempo_x10 else "-"
+        lines.append(
+            f"{summary.number:>4}  {summary.name or '(unnamed)':<14}  "
+            f"{_PLAIN_TRACK_INDICATORS[summary.track_flags]}  {tempo_str:>6}  "
+            f"{_PLAIN_BACKUP_INDICATORS[summary.has_backup]}"
+        )
+    click.echo("\n".join(lines))
+
+
 @cli.command("list")
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
-def list_cmd(roland_dir: str | None) -> None:
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=1, show_default=True,
+              help="Read memories on this many threads (helps on slow SD cards)")
+@click.option("--plain", is_flag=True, help="Print fixed-width text instead of a table (faster)")
+@_json_option
+def list_cmd(roland_dir: str | None, jobs: int, plain: bool, as_json: bool) -> None:
     """List all memories in a ROLAND/ backup directory."""
+
     roland_dir = _resolve_dir(roland_dir)
-    lib = RC505Library(roland_dir)
-    registry = _load_registry()
+    lib = _library(roland_dir)
+    summaries = lib.list_memories_summary(workers=jobs)
+
+    if as_json:
+        _echo_json([
+            {
+                "number": summary.number,
+                "name": summary.name,
+                "tracks": list(summary.track_flags),
+                "tempo": summary.tempo_x10 / 10 if summary.tempo_x10 else None,
+                "has_backup": summary.has_backup,
+            }
+            for summary in summaries
+        ])
+        return
+
+    if plain:
+        _echo_memory_list_plain(summaries)
+        return
+
+    from rich.table import Table
 
+    console = _console()
     table = Table(title="RC-505 MK2 Memories")
     table.add_column("#", style="cyan", justify="right", width=4)
     table.add_column("Name", style="bold", min_width=14)
@@ -100,37 +267,14 @@ def list_cmd(roland_dir: str | None) -> None:
     table.add_column("Tempo", justify="right")
     table.add_column("Backup", justify="center")
 
-    for slot in lib.list_memories():
-        if not slot.exists:
-            continue
-
-        rc0 = lib.parse_memory(slot.number)
-        mem = Memory(rc0, registry)
-        name = mem.name or "(unnamed)"
-
-        # Count tracks with audio
-        track_indicators = []
-        tempo_str = ""
-        for t in range(1, 6):
-            track = mem.track(t)
-            if track and track.get_by_tag("W") == 1:
-                track_indicators.append(f"[green]{t}[/green]")
-                if not tempo_str:
-                    tempo_x10 = track.get_by_tag("U")
-                    if tempo_x10:
-                        tempo_str = f"{tempo_x10 / 10:.1f}"
-            else:
-                track_indicators.append(f"[dim]{t}[/dim]")
-
-        tracks_str = " ".join(track_indicators)
-        backup = "[green]Y[/green]" if slot.has_backup else "[red]N[/red]"
-
+    for summary in summaries:
+        tempo_str = f"{summary.tempo_x10 / 10:.1f}" if summary.tempo_x10 else ""
         table.add_row(
-            str(slot.number),
-            name,
-            tracks_str,
+            str(summary.number),
+            summary.name or "(unnamed)",
+            _TRACK_INDICATORS[summary.track_flags],
             tempo_str or "[dim]-[/dim]",
-            backup,
+            _BACKUP_INDICATORS[summary.has_backup],
         )
 
     console.print(table)
@@ -138,19 +282,20 @@ def list_cmd(roland_dir: str | None) -> None:
 
 @cli.command()
 @click.argument("memory_num", type=int)
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
 @click.option("--section", "-s", help="Show only this section (e.g., TRACK1, MASTER)")
 @click.option("--raw", is_flag=True, help="Show raw tag names instead of resolved names")
-def show(memory_num: int, roland_dir: str | None, section: str | None, raw: bool) -> None:
+@_json_option
+def show(
+    memory_num: int, roland_dir: str | None, section: str | None, raw: bool, as_json: bool
+) -> None:
     """Show parameters for a memory slot."""
     roland_dir = _resolve_dir(roland_dir)
-    _, mem, _ = _open_memory(roland_dir, memory_num)
-
-    console.print(f"[bold]Memory {memory_num:03d}[/bold]: {mem.name or '(unnamed)'}")
-    console.print()
+    _, mem, _ = _open_memory(roland_dir, memory_num, readonly=True)
 
     sections_to_show = [section] if section else mem.section_names
+    tables: list[tuple[str, list[tuple[str, str, str, str]]]] = []
 
     for sec_name in sections_to_show:
         resolved = mem.section(sec_name)
@@ -158,57 +303,74 @@ def show(memory_num: int, roland_dir: str | None, section: str | None, raw: bool
             continue
 
         # Skip sections with no fields
-        if not resolved.raw.fields:
+        raw_fields = resolved.raw.fields
+        if not raw_fields:
             continue
 
-        table = Table(title=sec_name, show_header=True)
-        table.add_column("Tag", style="dim", width=4)
-        table.add_column("Parameter", style="cyan", min_width=20)
-        table.add_column("Value", justify="right")
-        table.add_column("Display", style="green")
-
-        for tag, value in resolved.raw.fields.items():
-            if raw or resolved.schema is None:
-                param_name = tag
-                display_val = str(value)
-            else:
-                fd = resolved.schema.fields.get(tag)
-                if fd:
-                    param_name = fd.display or fd.name
-                    if fd.choices and value in fd.choices:
-                        display_val = fd.choices[value]
-                    elif fd.unit:
-                        display_val = f"{value} {fd.unit}"
-                    else:
-                        display_val = str(value)
-                else:
-                    param_name = tag
-                    display_val = str(value)
+        schema = resolved.schema
+        fields = None if raw or schema is None else schema.fields
+        rows = [_param_row(tag, value, fields) for tag, value in raw_fields.items()]
+        tables.append((sec_name, rows))
+
+    if as_json:
+        _echo_json({
+            "memory": memory_num,
+            "name": mem.name,
+            "sections": {
+                sec_name: [
+                    {"tag": tag, "parameter": param, "value": int(value), "display": display}
+                    for tag, param, value, display in rows
+                ]
+                for sec_name, rows in tables
+            },
+        })
+        return
 
-            table.add_row(tag, param_name, str(value), display_val)
+    from rich.table import Table
 
-        console.print(table)
+    console = _console()
+    with console:  # buffer the whole report into one write
+        console.print(f"[bold]Memory {memory_num:03d}[/bold]: {mem.name or '(unnamed)'}")
         console.print()
 
+        for sec_name, rows in tables:
+            table = Table(title=sec_name, show_header=True)
+            table.add_column("Tag", style="dim", width=4)
+            table.add_column("Parameter", style="cyan", min_width=20)
+            table.add_column("Value", justify="right")
+            table.add_column("Display", style="green")
+            for row in rows:
+                table.add_row(*row)
+
+            console.print(table)
+            console.print()
+
 
 @cli.command()
 @click.argument("rc0_file", type=click.Path(exists=True, dir_okay=False))
 def parse(rc0_file: str) -> None:
     """Parse and display raw structure of an RC0 file."""
-    rc0 = parse_memory_file(rc0_file)
+    from eastlight.core.parser import parse_memory_file
 
-    console.print(f"[bold]File[/bold]: {rc0.path.name}")
-    console.print(f"[bold]Device[/bold]: {rc0.device_name}")
-    console.print(f"[bold]Revision[/bold]: {rc0.revision}")
-    console.print(f"[bold]Count[/bold]: {rc0.count}")
-    console.print()
+    rc0 = parse_memory_file(rc0_file)
 
+    # Hundreds of plain lines: styled with click and written once, no Rich
+    lines = [
+        f"{click.style('File', bold=True)}: {rc0.path.name}",
+        f"{click.style('Device', bold=True)}: {rc0.device_name}",
+        f"{click.style('Revision', bold=True)}: {rc0.revision}",
+        f"{click.style('Count', bold=True)}: {rc0.count}",
+        "",
+    ]
     for element in rc0.elements:
         id_str = f' id="{element.id}"' if element.id is not None else ""
-        console.print(f"[bold cyan]<{element.element}{id_str}>[/bold cyan]")
-        console.print(f"  Sections: {len(element.sections)}")
-        for sec_name, section in element.sections.items():
-            console.print(f"  [dim]{sec_name}[/dim]: {len(section.fields)} fields")
+        lines.append(click.style(f"<{element.element}{id_str}>", fg="cyan", bold=True))
+        lines.append(f"  Sections: {len(element.sections)}")
+        lines.extend(
+            f"  {click.style(sec_name, dim=True)}: {len(section.fields)} fields"
+            for sec_name, section in element.sections.items()
+        )
+    click.echo("\n".join(lines))
 
 
 # --- New commands: set, name, copy, diff, swap ---
@@ -219,7 +381,7 @@ def parse(rc0_file: str) -> None:
 @click.argument("section_name")
 @click.argument("param_name")
 @click.argument("value", type=int)
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
 @click.option("--dry-run", "-n", is_flag=True, help="Show what would change without writing")
 def set_cmd(
@@ -234,8 +396,39 @@ def set_cmd(
 
     Example: eastlight set 1 MASTER tempo_x10 800
     """
+    from eastlight.core.model import Memory
+
+    console = _console()
     roland_dir = _resolve_dir(roland_dir)
-    lib, mem, _ = _open_memory(roland_dir, memory_num)
+    lib = _library(roland_dir)
+    with lib.transaction(memory_num, commit=not dry_run) as rc0:
+        mem = Memory(rc0, _load_registry())
+        tag, old_value = _set_param(
+            mem, memory_num, section_name, param_name, value, apply=not dry_run
+        )
+    if not dry_run:
+        _remember_saved(lib, memory_num, rc0)
+
+    prefix = "[dim](dry-run)[/dim]" if dry_run else "[green]Set[/green]"
+    console.print(
+        f"{prefix} {section_name}.{param_name} ({tag}): {old_value} → {value}"
+    )
+
+
+def _set_param(
+    mem: Memory,
+    memory_num: int,
+    section_name: str,
+    param_name: str,
+    value: int,
+    *,
+    apply: bool,
+) -> tuple[str, int | None]:
+    """Resolve and (unless ``apply`` is False) set one memory parameter.
+
+    Returns (tag, old_value). Raises ClickException if the section or
+    parameter does not exist.
+    """
     resolved = mem.section(section_name)
     if resolved is None:
         raise click.ClickException(
@@ -253,42 +446,113 @@ def set_cmd(
         old_value = resolved.get_by_tag(param_name)
         tag = param_name
         _validate_warn(resolved.schema, param_name, value)
-        if not dry_run:
+        if apply:
             resolved.set_by_tag(param_name, value)
     else:
         tag = resolved.schema.name_to_tag(param_name) if resolved.schema else param_name
         _validate_warn(resolved.schema, tag, value)
-        if not dry_run:
+        if apply:
             resolved.set_by_name(param_name, value)
-
-    if dry_run:
-        console.print(
-            f"[dim](dry-run)[/dim] {section_name}.{param_name} "
-            f"({tag}): {old_value} → {value}"
+    return tag, old_value
+
+
+def _parse_set_edit(spec: str) -> tuple[str, str, int]:
+    """Parse a ``SECTION:PARAM=VALUE`` edit spec for set-many."""
+    target, sep, raw_value = spec.rpartition("=")
+    section_name, colon, param_name = target.partition(":")
+    if not sep or not colon or not section_name or not param_name:
+        raise click.BadParameter(
+            f"'{spec}' is not of the form SECTION:PARAM=VALUE "
+            "(e.g. MASTER:tempo_x10=800).",
+            param_hint="'--edit'",
         )
-    else:
-        lib.save_memory(memory_num, mem.rc0)
+    try:
+        value = int(raw_value)
+    except ValueError:
+        raise click.BadParameter(
+            f"'{raw_value}' in '{spec}' is not an integer.", param_hint="'--edit'"
+        ) from None
+    return section_name, param_name, value
+
+
+@cli.command("set-many")
+@click.argument("memory_num", type=int)
+@click.option("--edit", "-e", "edits", multiple=True,
+              help="SECTION:PARAM=VALUE (repeatable)")
+@click.option("--file", "-f", "edit_file", type=click.File("r"), default=None,
+              help="Read SECTION:PARAM=VALUE edits, one per line ('-' for stdin)")
+@click.option("--dir", "-d", "roland_dir", type=str,
+              default=None, help="ROLAND/ directory (default: config or auto-detect)")
+@click.option("--dry-run", "-n", is_flag=True, help="Show what would change without writing")
+def set_many(
+    memory_num: int,
+    edits: tuple[str, ...],
+    edit_file: TextIO | None,
+    roland_dir: str | None,
+    dry_run: bool,
+) -> None:
+    """Set several parameters with a single read and write of the memory.
+
+    Edits are applied in order (--edit options first, then --file lines);
+    if any edit fails, nothing is written. Blank lines and lines starting
+    with '#' in the file are ignored.
+
+    Example:
+
+    \b
+      eastlight set-many 1 -e MASTER:tempo_x10=800 -e TRACK1:pan=50
+      eastlight set-many 1 -f edits.txt
+    """
+    from eastlight.core.model import Memory
+
+    console = _console()
+    specs = list(edits)
+    if edit_file is not None:
+        for line in edit_file:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                specs.append(line)
+    if not specs:
+        raise click.UsageError("No edits given; use --edit or --file.")
+    parsed = [_parse_set_edit(spec) for spec in specs]
+    roland_dir = _resolve_dir(roland_dir)
+    lib = _library(roland_dir)
+
+    results = []
+    with lib.transaction(memory_num, commit=not dry_run) as rc0:
+        mem = Memory(rc0, _load_registry())
+        for section_name, param_name, value in parsed:
+            tag, old_value = _set_param(
+                mem, memory_num, section_name, param_name, value, apply=not dry_run
+            )
+            results.append((section_name, param_name, tag, old_value, value))
+    if not dry_run:
+        _remember_saved(lib, memory_num, rc0)
+
+    prefix = "[dim](dry-run)[/dim]" if dry_run else "[green]Set[/green]"
+    for section_name, param_name, tag, old_value, value in results:
         console.print(
-            f"[green]Set[/green] {section_name}.{param_name} "
-            f"({tag}): {old_value} → {value}"
+            f"{prefix} {section_name}.{param_name} ({tag}): {old_value} → {value}"
         )
 
 
 @cli.command()
 @click.argument("memory_num", type=int)
 @click.argument("new_name")
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
 def name(memory_num: int, new_name: str, roland_dir: str | None) -> None:
     """Rename a memory slot.
 
     Example: eastlight name 1 "My Loop"
     """
+    console = _console()
     roland_dir = _resolve_dir(roland_dir)
     lib, mem, _ = _open_memory(roland_dir, memory_num)
     old_name = mem.name
     mem.set_name(new_name)
     lib.save_memory(memory_num, mem.rc0)
+    _remember_saved(lib, memory_num, mem.rc0)
     console.print(
         f"[green]Renamed[/green] memory {memory_num:03d}: "
         f"'{old_name}' → '{mem.name}'"
@@ -298,16 +562,18 @@ def name(memory_num: int, new_name: str, roland_dir: str | None) -> None:
 @cli.command()
 @click.argument("src", type=int)
 @click.argument("dst", type=int)
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
-@click.option("--force", is_flag=True, help="Overwrite destination without prompting")
+@click.option("--force", is_flag=True, envvar="EASTLIGHT_ASSUME_YES",
+              help="Overwrite destination without prompting")
 def copy(src: int, dst: int, roland_dir: str | None, force: bool) -> None:
     """Copy a memory slot to another slot (RC0 + WAV).
 
     Example: eastlight copy 1 50
     """
+    console = _console()
     roland_dir = _resolve_dir(roland_dir)
-    lib = RC505Library(roland_dir)
+    lib = _library(roland_dir)
 
     src_slot = lib.memory_slot(src)
     if not src_slot.exists:
@@ -322,6 +588,7 @@ def copy(src: int, dst: int, roland_dir: str | None, force: bool) -> None:
             raise click.Abort()
 
     lib.copy_memory(src, dst)
+    _forget_memories(lib, dst)
 
     src_name = lib.memory_name(src) or "(unnamed)"
     console.print(
@@ -332,15 +599,16 @@ def copy(src: int, dst: int, roland_dir: str | None, force: bool) -> None:
 @cli.command()
 @click.argument("mem_a", type=int)
 @click.argument("mem_b", type=int)
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
 def swap(mem_a: int, mem_b: int, roland_dir: str | None) -> None:
     """Swap two memory slots (RC0 + WAV).
 
     Example: eastlight swap 1 50
     """
+    console = _console()
     roland_dir = _resolve_dir(roland_dir)
-    lib = RC505Library(roland_dir)
+    lib = _library(roland_dir)
 
     slot_a = lib.memory_slot(mem_a)
     slot_b = lib.memory_slot(mem_b)
@@ -353,6 +621,7 @@ def swap(mem_a: int, mem_b: int, roland_dir: str | None) -> None:
     name_b = lib.memory_name(mem_b) or "(unnamed)"
 
     lib.swap_memories(mem_a, mem_b)
+    _forget_memories(lib, mem_a, mem_b)
     console.print(
         f"[green]Swapped[/green] {mem_a:03d} ('{name_a}') ↔ {mem_b:03d} ('{name_b}')"
     )
@@ -360,9 +629,10 @@ def swap(mem_a: int, mem_b: int, roland_dir: str | None) -> None:
 
 @cli.command()
 @click.argument("memory_num", type=int)
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
-@click.option("--force", is_flag=True, help="Skip confirmation prompt")
+@click.option("--force", is_flag=True, envvar="EASTLIGHT_ASSUME_YES",
+              help="Skip confirmation prompt")
 @click.option("--dry-run", "-n", is_flag=True, help="Show what would be deleted without writing")
 def clear(memory_num: int, roland_dir: str | None, force: bool, dry_run: bool) -> None:
     """Clear a memory slot (remove RC0 files and WAV audio).
@@ -371,8 +641,9 @@ def clear(memory_num: int, roland_dir: str | None, force: bool, dry_run: bool) -
 
     Example: eastlight clear 5
     """
+    console = _console()
     roland_dir = _resolve_dir(roland_dir)
-    lib = RC505Library(roland_dir)
+    lib = _library(roland_dir)
     slot = lib.memory_slot(memory_num)
 
     if not slot.exists:
@@ -387,7 +658,7 @@ def clear(memory_num: int, roland_dir: str | None, force: bool, dry_run: bool) -
             if p.exists():
                 console.print(f"  delete {p.name}")
         for t in range(1, 6):
-            w = lib.wave_dir / f"{memory_num:03d}_{t}" / f"{memory_num:03d}_{t}.WAV"
+            w = lib.track_wav_path(memory_num, t)
             if w.exists():
                 console.print(f"  delete {w.parent.name}/{w.name}")
         return
@@ -399,6 +670,7 @@ def clear(memory_num: int, roland_dir: str | None, force: bool, dry_run: bool) -
             raise click.Abort()
 
     lib.clear_memory(memory_num)
+    _forget_memories(lib, memory_num)
     console.print(
         f"[green]Cleared[/green] memory {memory_num:03d} ('{name}')"
     )
@@ -407,31 +679,33 @@ def clear(memory_num: int, roland_dir: str | None, force: bool, dry_run: bool) -
 @cli.command()
 @click.argument("mem_a", type=int)
 @click.argument("mem_b", type=int)
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
 @click.option("--section", "-s", help="Compare only this section")
-def diff(mem_a: int, mem_b: int, roland_dir: str | None, section: str | None) -> None:
+@_json_option
+def diff(
+    mem_a: int, mem_b: int, roland_dir: str | None, section: str | None, as_json: bool
+) -> None:
     """Show differences between two memories.
 
     Example: eastlight diff 1 3
     """
+    from eastlight.core.model import Memory
+
     roland_dir = _resolve_dir(roland_dir)
-    registry = _load_registry()
-    lib = RC505Library(roland_dir)
-    rc0_a = lib.parse_memory(mem_a)
-    rc0_b = lib.parse_memory(mem_b)
-    ma = Memory(rc0_a, registry)
-    mb = Memory(rc0_b, registry)
-
-    name_a = ma.name or "(unnamed)"
-    name_b = mb.name or "(unnamed)"
-    console.print(
-        f"[bold]Diff[/bold]: {mem_a:03d} ('{name_a}') vs {mem_b:03d} ('{name_b}')"
-    )
-    console.print()
+    lib = _library(roland_dir)
+    if lib.memories_identical(mem_a, mem_b):
+        # Same bytes apart from slot ids: nothing to parse or compare
+        name_a = name_b = lib.memory_name(mem_a)
+        sections_to_check = []
+    else:
+        registry = _load_registry()
+        ma = Memory(_read_memory(lib, mem_a), registry)
+        mb = Memory(_read_memory(lib, mem_b), registry)
+        name_a, name_b = ma.name, mb.name
+        sections_to_check = [section] if section else ma.section_names
 
-    sections_to_check = [section] if section else ma.section_names
-    total_diffs = 0
+    section_diffs: list[tuple[str, list[tuple[str, str, int | None, int | None]]]] = []
 
     for sec_name in sections_to_check:
         sa = ma.section(sec_name)
@@ -439,27 +713,58 @@ def diff(mem_a: int, mem_b: int, roland_dir: str | None, section: str | None) ->
         if sa is None or sb is None:
             continue
 
-        diffs = []
-        all_tags = set(sa.raw.fields.keys()) | set(sb.raw.fields.keys())
-        for tag in sorted(all_tags):
-            val_a = sa.raw.fields.get(tag)
-            val_b = sb.raw.fields.get(tag)
-            if val_a != val_b:
-                # Resolve parameter name from schema
-                param = tag
-                if sa.schema:
-                    fd = sa.schema.fields.get(tag)
-                    if fd:
-                        param = fd.display or fd.name
-                diffs.append((tag, param, val_a, val_b))
+        fields_a = sa.raw.fields
+        fields_b = sb.raw.fields
+        if fields_a == fields_b:
+            continue
+
+        # Tags in file order: A's tags, then any that only B has
+        labels = sa.schema.display_names if sa.schema else {}
+        diffs = [
+            (tag, labels.get(tag, tag), val_a, val_b)
+            for tag, val_a in fields_a.items()
+            if (val_b := fields_b.get(tag)) != val_a
+        ]
+        diffs.extend(
+            (tag, labels.get(tag, tag), None, val_b)
+            for tag, val_b in fields_b.items()
+            if tag not in fields_a
+        )
 
         if diffs:
+            section_diffs.append((sec_name, diffs))
+
+    if as_json:
+        _echo_json({
+            "a": {"memory": mem_a, "name": name_a},
+            "b": {"memory": mem_b, "name": name_b},
+            "sections": {
+                sec_name: [
+                    {"tag": tag, "parameter": param, "a": va, "b": vb}
+                    for tag, param, va, vb in diffs
+                ]
+                for sec_name, diffs in section_diffs
+            },
+        })
+        return
+
+    from rich.table import Table
+
+    console = _console()
+    with console:
+        console.print(
+            f"[bold]Diff[/bold]: {mem_a:03d} ('{name_a or '(unnamed)'}') "
+            f"vs {mem_b:03d} ('{name_b or '(unnamed)'}')"
+        )
+        console.print()
+
+        total_diffs = 0
+        for sec_name, diffs in section_diffs:
             table = Table(title=sec_name, show_header=True)
             table.add_column("Tag", style="dim", width=4)
             table.add_column("Parameter", style="cyan", min_width=20)
             table.add_column(f"{mem_a:03d}", justify="right", style="red")
             table.add_column(f"{mem_b:03d}", justify="right", style="green")
-
             for tag, param, va, vb in diffs:
                 table.add_row(
                     tag,
@@ -472,10 +777,10 @@ def diff(mem_a: int, mem_b: int, roland_dir: str | None, section: str | None) ->
             console.print()
             total_diffs += len(diffs)
 
-    if total_diffs == 0:
-        console.print("[dim]No differences found.[/dim]")
-    else:
-        console.print(f"[bold]{total_diffs}[/bold] difference(s) found.")
+        if total_diffs == 0:
+            console.print("[dim]No differences found.[/dim]")
+        else:
+            console.print(f"[bold]{total_diffs}[/bold] difference(s) found.")
 
 
 # --- WAV commands ---
@@ -483,23 +788,51 @@ def diff(mem_a: int, mem_b: int, roland_dir: str | None, section: str | None) ->
 
 @cli.command("wav-info")
 @click.argument("memory_num", type=int)
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
 @click.option("--track", "-t", type=int, default=None, help="Show only this track (1-5)")
-def wav_info_cmd(memory_num: int, roland_dir: str | None, track: int | None) -> None:
+@_json_option
+def wav_info_cmd(
+    memory_num: int, roland_dir: str | None, track: int | None, as_json: bool
+) -> None:
     """Show WAV audio info for a memory's tracks.
 
     Example: eastlight wav-info 1
     """
+    from eastlight.core.wav import wav_info
+
     roland_dir = _resolve_dir(roland_dir)
-    lib = RC505Library(roland_dir)
+    lib = _library(roland_dir)
     slot = lib.memory_slot(memory_num)
 
     if not slot.exists:
         raise click.ClickException(f"Memory {memory_num:03d} does not exist.")
 
     tracks = [track] if track else range(1, 6)
+    infos = {t: (wav_info(p) if (p := slot.track_wav(t)) else None) for t in tracks}
+
+    if as_json:
+        _echo_json({
+            "memory": memory_num,
+            "tracks": [
+                {"track": t, "audio": False} if info is None else {
+                    "track": t,
+                    "audio": True,
+                    "duration": info.duration,
+                    "sample_rate": info.sample_rate,
+                    "channels": info.channels,
+                    "frames": info.frames,
+                    "format": info.format,
+                    "subtype": info.subtype,
+                }
+                for t, info in infos.items()
+            ],
+        })
+        return
 
+    from rich.table import Table
+
+    console = _console()
     table = Table(title=f"Memory {memory_num:03d} — Audio Tracks")
     table.add_column("Track", style="cyan", justify="right")
     table.add_column("Status", justify="center")
@@ -509,14 +842,12 @@ def wav_info_cmd(memory_num: int, roland_dir: str | None, track: int | None) ->
     table.add_column("Format", style="dim")
 
     found = False
-    for t in tracks:
-        wav_path = slot.track_wav(t)
-        if wav_path is None:
+    for t, info in infos.items():
+        if info is None:
             table.add_row(str(t), "[dim]empty[/dim]", "-", "-", "-", "-")
             continue
 
         found = True
-        info = wav_info(wav_path)
         minutes = int(info.duration // 60)
         seconds = info.duration % 60
         dur_str = f"{minutes}:{seconds:05.2f}" if minutes else f"{seconds:.2f}s"
@@ -530,17 +861,17 @@ def wav_info_cmd(memory_num: int, roland_dir: str | None, track: int | None) ->
             f"{info.subtype} {info.format}",
         )
 
-    console.print(table)
-
-    if not found and track:
-        console.print(f"[dim]Track {track} has no audio.[/dim]")
+    with console:
+        console.print(table)
+        if not found and track:
+            console.print(f"[dim]Track {track} has no audio.[/dim]")
 
 
 @cli.command("wav-export")
 @click.argument("memory_num", type=int)
 @click.argument("track_num", type=int)
 @click.argument("output", type=click.Path(dir_okay=False))
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
 @click.option(
     "--format",
@@ -549,8 +880,15 @@ def wav_info_cmd(memory_num: int, roland_dir: str | None, track: int | None) ->
     default="float32",
     help="Export format (default: float32 — native lossless)",
 )
+@click.option("--reencode", is_flag=True,
+              help="Decode and re-encode even when the track can be copied as-is")
 def wav_export_cmd(
-    memory_num: int, track_num: int, output: str, roland_dir: str | None, fmt: str
+    memory_num: int,
+    track_num: int,
+    output: str,
+    roland_dir: str | None,
+    fmt: str,
+    reencode: bool,
 ) -> None:
     """Export a track's audio to a WAV file.
 
@@ -559,8 +897,11 @@ def wav_export_cmd(
 
     Example: eastlight wav-export 1 1 my_loop.wav
     """
+    from eastlight.core.wav import ExportFormat, wav_export_file, wav_info
+
+    console = _console()
     roland_dir = _resolve_dir(roland_dir)
-    lib = RC505Library(roland_dir)
+    lib = _library(roland_dir)
     slot = lib.memory_slot(memory_num)
 
     if not slot.exists:
@@ -579,11 +920,8 @@ def wav_export_cmd(
     }
     export_fmt = format_map[fmt]
 
-    from eastlight.core.wav import wav_read
-
-    data, sr = wav_read(wav_path)
     out_path = Path(output)
-    wav_export(out_path, data, sr, export_fmt)
+    wav_export_file(wav_path, out_path, export_fmt, reencode=reencode)
 
     info = wav_info(out_path)
     console.print(
@@ -596,9 +934,10 @@ def wav_export_cmd(
 @click.argument("memory_num", type=int)
 @click.argument("track_num", type=int)
 @click.argument("input_file", type=click.Path(exists=True, dir_okay=False))
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
-@click.option("--force", is_flag=True, help="Overwrite existing track audio without prompting")
+@click.option("--force", is_flag=True, envvar="EASTLIGHT_ASSUME_YES",
+              help="Overwrite existing track audio without prompting")
 def wav_import_cmd(
     memory_num: int,
     track_num: int,
@@ -614,8 +953,12 @@ def wav_import_cmd(
 
     Example: eastlight wav-import 1 1 my_recording.wav
     """
+    from eastlight.core.model import Memory
+    from eastlight.core.wav import DEVICE_SAMPLE_RATE, stream_import_audio
+
+    console = _console()
     roland_dir = _resolve_dir(roland_dir)
-    lib = RC505Library(roland_dir)
+    lib = _library(roland_dir)
     slot = lib.memory_slot(memory_num)
 
     if not slot.exists:
@@ -632,48 +975,39 @@ def wav_import_cmd(
         ):
             raise click.Abort()
 
-    # Import and convert audio
-    data, sr = import_audio(input_file)
+    # Parse the memory once; the WAV write below doesn't touch the RC0
+    mem = Memory(lib.parse_memory(memory_num), _load_registry())
 
-    if sr != DEVICE_SAMPLE_RATE:
-        raise click.ClickException(
-            f"Sample rate mismatch: source is {sr} Hz, device requires {DEVICE_SAMPLE_RATE} Hz. "
-            f"Please resample your audio to {DEVICE_SAMPLE_RATE} Hz before importing."
-        )
-
-    # Write to device WAV location
-    wav_dir = lib.wave_dir / f"{memory_num:03d}_{track_num}"
-    wav_dir.mkdir(parents=True, exist_ok=True)
-    dst_path = wav_dir / f"{memory_num:03d}_{track_num}.WAV"
-    wav_write_device(dst_path, data, sr)
+    # Convert and write to the device WAV location, one block at a time
+    dst_path = lib.track_wav_path(memory_num, track_num)
+    try:
+        total_samples = stream_import_audio(input_file, dst_path)
+    except ValueError as e:
+        raise click.ClickException(str(e)) from None
 
     # Update track metadata in the RC0 file
-    registry = _load_registry()
-    rc0 = lib.parse_memory(memory_num)
-    mem = Memory(rc0, registry)
     track = mem.track(track_num)
     if track is not None:
-        total_samples = data.shape[0]
         track.set_by_tag("W", 1)  # has_audio = true
         track.set_by_tag("X", total_samples)  # total_samples
-        # Compute samples_per_measure from tempo if available
+        # Compute samples_per_measure from tempo if available: four beats of
+        # DEVICE_SAMPLE_RATE * 60 / (tempo_x10 / 10) samples, in exact integers
         tempo_x10 = track.get_by_tag("U")
-        if tempo_x10 and tempo_x10 > 0:
-            bpm = tempo_x10 / 10.0
-            samples_per_beat = DEVICE_SAMPLE_RATE * 60.0 / bpm
-            samples_per_measure = int(samples_per_beat * 4)
+        if tempo_x10 > 0:
+            samples_per_measure = DEVICE_SAMPLE_RATE * 2400 // tempo_x10
             track.set_by_tag("V", samples_per_measure)
             # Compute loop length in measures
             if samples_per_measure > 0:
                 measures = round(total_samples / samples_per_measure)
                 track.set_by_tag("S", max(1, measures))
-        lib.save_memory(memory_num, rc0)
+        lib.save_memory(memory_num, mem.rc0)
+        _remember_saved(lib, memory_num, mem.rc0)
 
-    dur = data.shape[0] / sr
+    dur = total_samples / DEVICE_SAMPLE_RATE
     console.print(
         f"[green]Imported[/green] {Path(input_file).name} → "
         f"memory {memory_num:03d} track {track_num} "
-        f"({dur:.2f}s, {data.shape[0]} samples)"
+        f"({dur:.2f}s, {total_samples} samples)"
     )
 
 
@@ -683,16 +1017,18 @@ def wav_import_cmd(
 _FX_CHAINS = {"ifx": "Input FX", "tfx": "Track FX"}
 _FX_GROUPS = ["A", "B", "C", "D"]
 _FX_SLOTS = ["A", "B", "C", "D"]
+_ALL_SUBSLOTS = tuple(f"{g}{s}" for g in _FX_GROUPS for s in _FX_SLOTS)
 
 
 @cli.command("fx-show")
 @click.argument("memory_num", type=int)
 @click.argument("chain", type=click.Choice(["ifx", "tfx"]))
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
 @click.option("--group", "-g", type=click.Choice(_FX_GROUPS), help="Show only this group (A-D)")
 @click.option("--slot", "-s", help="Show only this subslot (e.g., AA, AB, CD)")
 @click.option("--raw", is_flag=True, help="Show raw tag names instead of resolved names")
+@_json_option
 def fx_show(
     memory_num: int,
     chain: str,
@@ -700,6 +1036,7 @@ def fx_show(
     group: str | None,
     slot: str | None,
     raw: bool,
+    as_json: bool,
 ) -> None:
     """Show FX chain parameters for a memory.
 
@@ -713,71 +1050,93 @@ def fx_show(
       eastlight fx-show 1 ifx -s AA
     """
     roland_dir = _resolve_dir(roland_dir)
-    lib, mem, registry = _open_memory(roland_dir, memory_num)
+    lib, mem, registry = _open_memory(roland_dir, memory_num, readonly=True)
     rc0 = mem.rc0
 
     fx_element = rc0.ifx if chain == "ifx" else rc0.tfx
     if fx_element is None:
         raise click.ClickException(f"No <{chain}> element in memory {memory_num:03d}.")
 
-    chain_label = _FX_CHAINS[chain]
-    console.print(
-        f"[bold]Memory {memory_num:03d}[/bold] — {chain_label}"
-    )
-    console.print()
-
-    fx_type_map = registry.fx_types.ifx_types if chain == "ifx" else registry.fx_types.tfx_types
+    fx_types = registry.fx_types
 
     # Determine which subslots to display
     if slot:
-        subslots = [slot.upper()]
+        subslots: tuple[str, ...] = (slot.upper(),)
     elif group:
-        subslots = [f"{group.upper()}{s}" for s in _FX_SLOTS]
+        subslots = tuple(ss for ss in _ALL_SUBSLOTS if ss[0] == group.upper())
     else:
-        subslots = [f"{g}{s}" for g in _FX_GROUPS for s in _FX_SLOTS]
+        subslots = _ALL_SUBSLOTS
 
+    # (subslot, switch, fx type index, fx name, param rows or None)
+    entries: list[tuple[str, int, int, str, list[tuple[str, str, int]] | None]] = []
     for ss in subslots:
-        # Show subslot header (switch + active FX type)
         header_section = fx_element.sections.get(ss)
         if header_section is None:
             continue
 
         sw = header_section.get("A", 0)
         fx_type_idx = header_section.get("C", 0)
-        fx_name = fx_type_map.get(fx_type_idx, f"UNKNOWN({fx_type_idx})")
-        sw_str = "[green]ON[/green]" if sw else "[dim]OFF[/dim]"
-
-        console.print(
-            f"  [bold cyan]{ss}[/bold cyan]: {sw_str}  "
-            f"[yellow]{fx_name}[/yellow] (type {fx_type_idx})"
-        )
+        fx_name = fx_types.effect_name(chain, fx_type_idx)
 
-        # Show the active effect's parameters
+        # Collect the active effect's parameters
         active_section_name = f"{ss}_{fx_name}"
         section = fx_element.sections.get(active_section_name)
-        if section is None:
-            console.print(f"    [dim](no section '{active_section_name}')[/dim]")
-            console.print()
-            continue
-
-        schema = registry.get(active_section_name)
+        rows = None
+        if section is not None:
+            schema = registry.get(active_section_name)
+            labels = {} if raw or schema is None else schema.display_names
+            rows = [(tag, labels.get(tag, tag), value) for tag, value in section.fields.items()]
+        entries.append((ss, sw, fx_type_idx, fx_name, rows))
+
+    if as_json:
+        _echo_json({
+            "memory": memory_num,
+            "chain": chain,
+            "subslots": [
+                {
+                    "subslot": ss,
+                    "on": bool(sw),
+                    "type": fx_type_idx,
+                    "fx": fx_name,
+                    "parameters": None if rows is None else [
+                        {"tag": tag, "parameter": param, "value": value}
+                        for tag, param, value in rows
+                    ],
+                }
+                for ss, sw, fx_type_idx, fx_name, rows in entries
+            ],
+        })
+        return
 
-        table = Table(show_header=True, padding=(0, 1))
-        table.add_column("Tag", style="dim", width=4)
-        table.add_column("Parameter", style="cyan", min_width=16)
-        table.add_column("Value", justify="right")
+    from rich.table import Table
 
-        for tag, value in section.fields.items():
-            if raw or schema is None:
-                param_name = tag
-            else:
-                fd = schema.fields.get(tag)
-                param_name = (fd.display or fd.name) if fd else tag
+    # One table for all subslots, so Rich lays out the columns only once
+    table = Table(
+        title=f"Memory {memory_num:03d} — {_FX_CHAINS[chain]}",
+        show_header=True,
+        padding=(0, 1),
+    )
+    table.add_column("Tag", style="dim", width=4)
+    table.add_column("Parameter", style="cyan", min_width=16)
+    table.add_column("Value", justify="right")
 
-            table.add_row(tag, param_name, str(value))
+    for ss, sw, fx_type_idx, fx_name, rows in entries:
+        # Subslot header row: switch + active FX type
+        sw_str = "[green]ON[/green]" if sw else "[dim]OFF[/dim]"
+        table.add_row(
+            f"[bold cyan]{ss}[/bold cyan]",
+            f"{sw_str}  [yellow]{fx_name}[/yellow] (type {fx_type_idx})",
+            "",
+        )
+        if rows is None:
+            # e.g. an UNKNOWN(n) type has no parameter section
+            table.add_row("", f"[dim](no section '{ss}_{fx_name}')[/dim]", "", end_section=True)
+            continue
+        for tag, param, value in rows:
+            table.add_row(tag, param, str(value))
+        table.add_section()
 
-        console.print(table)
-        console.print()
+    _console().print(table)
 
 
 @cli.command("fx-set")
@@ -786,7 +1145,7 @@ def fx_show(
 @click.argument("subslot")
 @click.argument("param_name")
 @click.argument("value", type=int)
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
 @click.option("--dry-run", "-n", is_flag=True, help="Show what would change without writing")
 def fx_set(
@@ -814,16 +1173,44 @@ def fx_set(
       eastlight fx-set 1 tfx AA sw 1
       eastlight fx-set 1 ifx AA fx_type 35
     """
+    console = _console()
     roland_dir = _resolve_dir(roland_dir)
-    lib, mem, registry = _open_memory(roland_dir, memory_num)
-    rc0 = mem.rc0
+    lib = _library(roland_dir)
+    with lib.transaction(memory_num, commit=not dry_run) as rc0:
+        label, old_value = _set_fx_param(
+            rc0, _load_registry(), memory_num, chain, subslot, param_name, value,
+            apply=not dry_run,
+        )
+    if not dry_run:
+        _remember_saved(lib, memory_num, rc0)
+
+    prefix = "[dim](dry-run)[/dim]" if dry_run else "[green]Set[/green]"
+    console.print(f"{prefix} {chain}.{label}: {old_value} → {value}")
 
+
+def _set_fx_param(
+    rc0: RC0File,
+    registry: SchemaRegistry,
+    memory_num: int,
+    chain: str,
+    subslot: str,
+    param_name: str,
+    value: int,
+    *,
+    apply: bool,
+) -> tuple[str, int | None]:
+    """Resolve and (unless ``apply`` is False) set one FX parameter.
+
+    Header fields (sw, fx_type) are tried first, then the parameters of
+    the subslot's active effect. Returns (label, old_value) where label
+    reads like ``AA.DELAY.feedback (B)``.
+    """
     fx_element = rc0.ifx if chain == "ifx" else rc0.tfx
     if fx_element is None:
         raise click.ClickException(f"No <{chain}> element in memory {memory_num:03d}.")
 
     subslot = subslot.upper()
-    fx_type_map = registry.fx_types.ifx_types if chain == "ifx" else registry.fx_types.tfx_types
+    fx_types = registry.fx_types
 
     # Check if setting a header field (sw, fx_type)
     header_section = fx_element.sections.get(subslot)
@@ -842,26 +1229,17 @@ def fx_set(
             old_value = header_section.get(header_tag)
             display = param_name
             if param_name == "fx_type":
+                fx_type_map = fx_types.types(chain)
                 old_name = fx_type_map.get(old_value, str(old_value))
                 new_name = fx_type_map.get(value, str(value))
                 display = f"fx_type ({old_name} → {new_name})"
-            if dry_run:
-                console.print(
-                    f"[dim](dry-run)[/dim] {chain}.{subslot}.{display}: "
-                    f"{old_value} → {value}"
-                )
-            else:
+            if apply:
                 header_section[header_tag] = value
-                lib.save_memory(memory_num, rc0)
-                console.print(
-                    f"[green]Set[/green] {chain}.{subslot}.{display}: "
-                    f"{old_value} → {value}"
-                )
-            return
+            return f"{subslot}.{display}", old_value
 
     # Otherwise, set a parameter on the active effect
     fx_type_idx = header_section.get("C", 0)
-    fx_name = fx_type_map.get(fx_type_idx, f"UNKNOWN({fx_type_idx})")
+    fx_name = fx_types.effect_name(chain, fx_type_idx)
     effect_section_name = f"{subslot}_{fx_name}"
     effect_section = fx_element.sections.get(effect_section_name)
 
@@ -893,18 +1271,73 @@ def fx_set(
     if effect_schema and tag != param_name:
         display_name = f"{param_name} ({tag})"
 
-    if dry_run:
-        console.print(
-            f"[dim](dry-run)[/dim] {chain}.{subslot}.{fx_name}.{display_name}: "
-            f"{old_value} → {value}"
-        )
-    else:
+    if apply:
         effect_section[tag] = value
-        lib.save_memory(memory_num, rc0)
-        console.print(
-            f"[green]Set[/green] {chain}.{subslot}.{fx_name}.{display_name}: "
-            f"{old_value} → {value}"
+    return f"{subslot}.{fx_name}.{display_name}", old_value
+
+
+def _parse_fx_edit(spec: str) -> tuple[str, str, str, int]:
+    """Parse a ``CHAIN:SUBSLOT:PARAM=VALUE`` edit spec for fx-set-many."""
+    target, sep, raw_value = spec.rpartition("=")
+    parts = target.split(":")
+    if not sep or len(parts) != 3 or parts[0].lower() not in _FX_CHAINS:
+        raise click.BadParameter(
+            f"'{spec}' is not of the form CHAIN:SUBSLOT:PARAM=VALUE "
+            "(e.g. ifx:AA:feedback=30).",
+            param_hint="'--edit'",
         )
+    try:
+        value = int(raw_value)
+    except ValueError:
+        raise click.BadParameter(
+            f"'{raw_value}' in '{spec}' is not an integer.", param_hint="'--edit'"
+        ) from None
+    chain, subslot, param_name = parts
+    return chain.lower(), subslot, param_name, value
+
+
+@cli.command("fx-set-many")
+@click.argument("memory_num", type=int)
+@click.option("--edit", "-e", "edits", multiple=True, required=True,
+              help="CHAIN:SUBSLOT:PARAM=VALUE (repeatable)")
+@click.option("--dir", "-d", "roland_dir", type=str,
+              default=None, help="ROLAND/ directory (default: config or auto-detect)")
+@click.option("--dry-run", "-n", is_flag=True, help="Show what would change without writing")
+def fx_set_many(
+    memory_num: int,
+    edits: tuple[str, ...],
+    roland_dir: str | None,
+    dry_run: bool,
+) -> None:
+    """Set several FX parameters with a single read and write of the memory.
+
+    Edits are applied in order; if any edit fails, nothing is written.
+
+    Example:
+
+    \b
+      eastlight fx-set-many 1 -e ifx:AA:sw=1 -e ifx:AA:feedback=30 -e tfx:BA:fx_type=35
+    """
+    console = _console()
+    parsed = [_parse_fx_edit(spec) for spec in edits]
+    roland_dir = _resolve_dir(roland_dir)
+    registry = _load_registry()
+    lib = _library(roland_dir)
+
+    results = []
+    with lib.transaction(memory_num, commit=not dry_run) as rc0:
+        for chain, subslot, param_name, value in parsed:
+            label, old_value = _set_fx_param(
+                rc0, registry, memory_num, chain, subslot, param_name, value,
+                apply=not dry_run,
+            )
+            results.append((chain, label, old_value, value))
+    if not dry_run:
+        _remember_saved(lib, memory_num, rc0)
+
+    prefix = "[dim](dry-run)[/dim]" if dry_run else "[green]Set[/green]"
+    for chain, label, old_value, value in results:
+        console.print(f"{prefix} {chain}.{label}: {old_value} → {value}")
 
 
 # --- System commands ---
@@ -914,10 +1347,18 @@ def fx_set(
 _SYSTEM_KEY_SECTIONS = ["SETUP", "PREF", "COLOR", "USB", "MIDI"]
 
 
+def _system_section_name(
+    ctx: click.Context, param: click.Parameter, value: str | None
+) -> str | None:
+    """Click callback: upper-case a system section name at parse time."""
+    return value.upper() if value else value
+
+
 @cli.command("sys-show")
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
-@click.option("--section", "-s", help="Show only this section (e.g., SETUP, PREF, MIDI)")
+@click.option("--section", "-s", callback=_system_section_name,
+              help="Show only this section (e.g., SETUP, PREF, MIDI)")
 @click.option("--all", "show_all", is_flag=True, help="Show all sections including controllers")
 @click.option("--raw", is_flag=True, help="Show raw tag names instead of resolved names")
 @click.option("--variant", type=click.Choice(["1", "2"]), default="1",
@@ -943,8 +1384,11 @@ def sys_show(
       eastlight sys-show --all
       eastlight sys-show -s PREF --raw
     """
+    from rich.table import Table
+
+    console = _console()
     roland_dir = _resolve_dir(roland_dir)
-    lib = RC505Library(roland_dir)
+    lib = _library(roland_dir)
     registry = _load_registry()
     rc0 = lib.parse_system(int(variant))
 
@@ -952,61 +1396,44 @@ def sys_show(
     if sys_elem is None:
         raise click.ClickException("No <sys> element in system file.")
 
-    console.print(f"[bold]System Settings[/bold] (SYSTEM{variant}.RC0)")
-    console.print()
-
     if section:
-        sections_to_show = [section.upper()]
+        sections_to_show = [section]
     elif show_all:
         sections_to_show = list(sys_elem.section_names)
     else:
         sections_to_show = [s for s in _SYSTEM_KEY_SECTIONS if s in sys_elem.section_names]
 
+    # One table for all sections, so Rich lays out the columns only once
+    table = Table(show_header=True)
+    table.add_column("Tag", style="dim", width=4)
+    table.add_column("Parameter", style="cyan", min_width=20)
+    table.add_column("Value", justify="right")
+    table.add_column("Display", style="green")
+
     for sec_name in sections_to_show:
         sec = sys_elem.sections.get(sec_name)
-        if sec is None:
-            continue
-
-        if not sec.fields:
+        if sec is None or not sec.fields:
             continue
 
         schema = registry.get(sec_name)
-
-        table = Table(title=sec_name, show_header=True)
-        table.add_column("Tag", style="dim", width=4)
-        table.add_column("Parameter", style="cyan", min_width=20)
-        table.add_column("Value", justify="right")
-        table.add_column("Display", style="green")
-
+        fields = None if raw or schema is None else schema.fields
+        table.add_row("", f"[bold magenta]{sec_name}[/bold magenta]", "", "", end_section=True)
         for tag, value in sec.fields.items():
-            if raw or schema is None:
-                param_name = tag
-                display_val = str(value)
-            else:
-                fd = schema.fields.get(tag)
-                if fd:
-                    param_name = fd.display or fd.name
-                    if fd.choices and value in fd.choices:
-                        display_val = fd.choices[value]
-                    elif fd.unit:
-                        display_val = f"{value} {fd.unit}"
-                    else:
-                        display_val = str(value)
-                else:
-                    param_name = tag
-                    display_val = str(value)
-
-            table.add_row(tag, param_name, str(value), display_val)
+            table.add_row(*_param_row(tag, value, fields))
+        table.add_section()
 
-        console.print(table)
+    with console:
+        console.print(f"[bold]System Settings[/bold] (SYSTEM{variant}.RC0)")
         console.print()
+        if table.row_count:
+            console.print(table)
 
 
 @cli.command("sys-set")
-@click.argument("section_name")
+@click.argument("section_name", callback=_system_section_name)
 @click.argument("param_name")
 @click.argument("value", type=int)
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
 @click.option("--variant", type=click.Choice(["1", "2"]), default="1",
               help="System file variant (default: 1)")
@@ -1032,8 +1459,9 @@ def sys_set(
       eastlight sys-set PREF pref_eq 0
       eastlight sys-set MIDI A 1
     """
+    console = _console()
     roland_dir = _resolve_dir(roland_dir)
-    lib = RC505Library(roland_dir)
+    lib = _library(roland_dir)
     registry = _load_registry()
     var_int = int(variant)
     rc0 = lib.parse_system(var_int)
@@ -1042,7 +1470,6 @@ def sys_set(
     if sys_elem is None:
         raise click.ClickException("No <sys> element in system file.")
 
-    section_name = section_name.upper()
     sec = sys_elem.sections.get(section_name)
     if sec is None:
         raise click.ClickException(
@@ -1095,6 +1522,9 @@ def detect() -> None:
 
     Scans mounted volumes for ROLAND/ directories containing RC0 files.
     """
+    from eastlight.core.config import detect_device
+
+    console = _console()
     console.print("[bold]Scanning for RC-505 MK2 devices...[/bold]")
     devices = detect_device()
 
@@ -1120,8 +1550,7 @@ def detect() -> None:
 
 
 @cli.command()
-@click.option("--set-dir", type=click.Path(exists=True, file_okay=False),
-              help="Set default ROLAND/ directory path")
+@click.option("--set-dir", help="Set default ROLAND/ directory path")
 @click.option("--backup/--no-backup", default=None,
               help="Enable/disable automatic backup before writes")
 @click.option("--show", is_flag=True, help="Show current configuration")
@@ -1137,15 +1566,23 @@ def config(set_dir: str | None, backup: bool | None, show: bool) -> None:
       eastlight config --set-dir /media/user/RC505/ROLAND
       eastlight config --no-backup
     """
+    from eastlight.core.config import load_config, save_config
+
+    console = _console()
     cfg = load_config()
 
     if set_dir is not None:
+        if not Path(set_dir).is_dir():
+            raise click.BadParameter(
+                f"Directory '{set_dir}' does not exist.", param_hint="'--set-dir'"
+            )
         cfg.roland_dir = set_dir
         # Add to recent list
         if set_dir not in cfg.recent:
             cfg.recent.insert(0, set_dir)
             cfg.recent = cfg.recent[:10]  # Keep last 10
         path = save_config(cfg)
+        _resolve_dir.cache_clear()
         console.print(f"[green]Saved[/green] default directory: {set_dir}")
         console.print(f"[dim]Config: {path}[/dim]")
         return
@@ -1171,7 +1608,7 @@ def config(set_dir: str | None, backup: bool | None, show: bool) -> None:
 
 
 @cli.command("ctl-show")
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
 @click.option("--variant", type=click.Choice(["1", "2"]), default="1",
               help="System file variant (default: 1)")
@@ -1196,8 +1633,9 @@ def ctl_show(
       eastlight ctl-show --type ictl
       eastlight ctl-show --type ectl
     """
+    console = _console()
     roland_dir = _resolve_dir(roland_dir)
-    lib = RC505Library(roland_dir)
+    lib = _library(roland_dir)
     registry = _load_registry()
     rc0 = lib.parse_system(int(variant))
 
@@ -1208,19 +1646,23 @@ def ctl_show(
     show_ictl = ctl_type in ("ictl", "all")
     show_ectl = ctl_type in ("ectl", "all")
 
-    if show_ictl:
-        console.print(f"[bold]Internal Controllers[/bold] (SYSTEM{variant}.RC0)")
-        console.print()
-        _show_ctl_sections(sys_elem, registry, "ICTL", raw)
+    with console:
+        if show_ictl:
+            console.print(f"[bold]Internal Controllers[/bold] (SYSTEM{variant}.RC0)")
+            console.print()
+            _show_ctl_sections(sys_elem, registry, "ICTL", raw)
 
-    if show_ectl:
-        console.print(f"[bold]External Controllers[/bold] (SYSTEM{variant}.RC0)")
-        console.print()
-        _show_ctl_sections(sys_elem, registry, "ECTL", raw)
+        if show_ectl:
+            console.print(f"[bold]External Controllers[/bold] (SYSTEM{variant}.RC0)")
+            console.print()
+            _show_ctl_sections(sys_elem, registry, "ECTL", raw)
 
 
 def _show_ctl_sections(sys_elem, registry, prefix: str, raw: bool) -> None:
     """Display controller sections matching a prefix."""
+    from rich.table import Table
+
+    console = _console()
     table = Table(show_header=True)
     table.add_column("Section", style="cyan", min_width=24)
     table.add_column("Tag", style="dim", width=4)
@@ -1248,10 +1690,8 @@ def _show_ctl_sections(sys_elem, registry, prefix: str, raw: bool) -> None:
                 fd = schema.fields.get(tag)
                 if fd:
                     param_name = fd.display or fd.name
-                    if fd.choices and value in fd.choices:
-                        display_val = fd.choices[value]
-                    else:
-                        display_val = str(value)
+                    choice = fd.choices.get(value) if fd.choices else None
+                    display_val = choice if choice is not None else str(value)
                 else:
                     param_name = tag
                     display_val = str(value)
@@ -1266,10 +1706,10 @@ def _show_ctl_sections(sys_elem, registry, prefix: str, raw: bool) -> None:
 
 
 @cli.command("ctl-set")
-@click.argument("section_name")
+@click.argument("section_name", callback=_system_section_name)
 @click.argument("param_name")
 @click.argument("value", type=int)
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
 @click.option("--variant", type=click.Choice(["1", "2"]), default="1",
               help="System file variant (default: 1)")
@@ -1295,8 +1735,9 @@ def ctl_set(
       eastlight ctl-set ECTL_EXP1 ctl_range 64
       eastlight ctl-set ICTL1_PEDAL1 ctl_mode 0
     """
+    console = _console()
     roland_dir = _resolve_dir(roland_dir)
-    lib = RC505Library(roland_dir)
+    lib = _library(roland_dir)
     registry = _load_registry()
     var_int = int(variant)
     rc0 = lib.parse_system(var_int)
@@ -1305,7 +1746,6 @@ def ctl_set(
     if sys_elem is None:
         raise click.ClickException("No <sys> element in system file.")
 
-    section_name = section_name.upper()
     sec = sys_elem.sections.get(section_name)
     if sec is None:
         raise click.ClickException(
@@ -1356,15 +1796,18 @@ def backup() -> None:
 
 
 @backup.command("list")
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
 def backup_list(roland_dir: str | None) -> None:
     """List all backup snapshots.
 
     Shows timestamped backup snapshots with their files, newest first.
     """
+    from rich.table import Table
+
+    console = _console()
     roland_dir = _resolve_dir(roland_dir)
-    lib = RC505Library(roland_dir)
+    lib = _library(roland_dir)
     snapshots = lib.list_backups()
 
     if not snapshots:
@@ -1379,21 +1822,23 @@ def backup_list(roland_dir: str | None) -> None:
     for i, (ts, files) in enumerate(snapshots, 1):
         table.add_row(str(i), ts, str(len(files)))
 
-    console.print(table)
-    console.print(f"\n[dim]{len(snapshots)} snapshot(s)[/dim]")
+    with console:
+        console.print(table)
+        console.print(f"\n[dim]{len(snapshots)} snapshot(s)[/dim]")
 
 
 @backup.command("show")
 @click.argument("timestamp")
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
 def backup_show(timestamp: str, roland_dir: str | None) -> None:
     """Show files in a backup snapshot.
 
     TIMESTAMP is the snapshot identifier (from 'backup list').
     """
+    console = _console()
     roland_dir = _resolve_dir(roland_dir)
-    lib = RC505Library(roland_dir)
+    lib = _library(roland_dir)
     snapshots = lib.list_backups()
 
     found = None
@@ -1413,17 +1858,19 @@ def backup_show(timestamp: str, roland_dir: str | None) -> None:
 
 @backup.command("restore")
 @click.argument("timestamp")
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
-@click.option("--force", is_flag=True, help="Skip confirmation prompt")
+@click.option("--force", is_flag=True, envvar="EASTLIGHT_ASSUME_YES",
+              help="Skip confirmation prompt")
 def backup_restore(timestamp: str, roland_dir: str | None, force: bool) -> None:
     """Restore all files from a backup snapshot.
 
     TIMESTAMP is the snapshot identifier (from 'backup list').
     Overwrites current files with the backed-up versions.
     """
+    console = _console()
     roland_dir = _resolve_dir(roland_dir)
-    lib = RC505Library(roland_dir)
+    lib = _library(roland_dir)
 
     if not force:
         if not click.confirm(
@@ -1435,6 +1882,7 @@ def backup_restore(timestamp: str, roland_dir: str | None, force: bool) -> None:
         restored = lib.restore_backup(timestamp)
     except FileNotFoundError as e:
         raise click.ClickException(str(e))
+    _MEMORY_CACHE.clear()  # restored files keep the backup's mtime
 
     for rel in restored:
         console.print(f"  [green]Restored[/green] {rel}")
@@ -1442,7 +1890,7 @@ def backup_restore(timestamp: str, roland_dir: str | None, force: bool) -> None:
 
 
 @backup.command("prune")
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
 @click.option("--keep", "-k", type=int, default=5, show_default=True,
               help="Number of most recent snapshots to keep")
@@ -1451,8 +1899,9 @@ def backup_prune(roland_dir: str | None, keep: int) -> None:
 
     Example: eastlight backup prune --keep 3
     """
+    console = _console()
     roland_dir = _resolve_dir(roland_dir)
-    lib = RC505Library(roland_dir)
+    lib = _library(roland_dir)
     deleted = lib.prune_backups(keep=keep)
 
     if deleted == 0:
@@ -1469,7 +1918,7 @@ def backup_prune(roland_dir: str | None, keep: int) -> None:
 @cli.command("template-export")
 @click.argument("memory_num", type=int)
 @click.argument("output", type=click.Path(dir_okay=False))
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
 @click.option("--section", "-s", multiple=True,
               help="Export only these sections (can repeat). Default: all.")
@@ -1491,21 +1940,32 @@ def template_export(
       eastlight template-export 1 my_settings.yaml
       eastlight template-export 1 fx_only.yaml -s TRACK1 -s MASTER
     """
+    import yaml
+
+    console = _console()
     roland_dir = _resolve_dir(roland_dir)
-    _, mem, _ = _open_memory(roland_dir, memory_num)
+    rc0 = _read_memory(_library(roland_dir), memory_num)
 
-    sections_to_export = list(section) if section else mem.section_names
+    # Templates hold raw tags, so no schema resolution is needed; the
+    # field dicts are only read by the dumper, so they are not copied
+    sections = {
+        name: sec for element in rc0.elements for name, sec in element.sections.items()
+    }
+    sections_to_export = list(section) if section else list(sections)
     template: dict = {"_source": f"memory {memory_num:03d}", "_sections": {}}
 
     for sec_name in sections_to_export:
-        resolved = mem.section(sec_name)
-        if resolved is None:
+        sec = sections.get(sec_name)
+        if sec is None:
             continue
-        template["_sections"][sec_name] = dict(resolved.raw.fields)
+        template["_sections"][sec_name] = sec.fields
 
     out_path = Path(output)
-    with open(out_path, "w") as f:
-        yaml.dump(template, f, default_flow_style=False, sort_keys=False)
+    with open(out_path, "wb") as f:
+        yaml.dump(
+            template, f, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+            default_flow_style=False, sort_keys=False, encoding="utf-8",
+        )
 
     n = len(template["_sections"])
     console.print(
@@ -1516,7 +1976,7 @@ def template_export(
 @cli.command("template-apply")
 @click.argument("template_file", type=click.Path(exists=True, dir_okay=False))
 @click.argument("memory_nums", type=str)
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
 @click.option("--section", "-s", multiple=True,
               help="Apply only these sections from the template (can repeat)")
@@ -1539,12 +1999,14 @@ def template_apply(
       eastlight template-apply fx_only.yaml 1-10
       eastlight template-apply settings.yaml 1,3,5,7
     """
+    import yaml
+
+    console = _console()
     roland_dir = _resolve_dir(roland_dir)
-    lib = RC505Library(roland_dir)
-    registry = _load_registry()
+    lib = _library(roland_dir)
 
-    with open(template_file) as f:
-        template = yaml.safe_load(f)
+    with open(template_file, "rb") as f:
+        template = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
     sections_data = template.get("_sections", {})
     if not sections_data:
@@ -1556,33 +2018,45 @@ def template_apply(
 
     # Parse memory number ranges
     targets = _parse_memory_range(memory_nums)
+    plan = [(sec_name, list(fields.items())) for sec_name, fields in sections_data.items()]
 
-    applied = 0
+    applied = unchanged = 0
     for num in targets:
-        slot = lib.memory_slot(num)
-        if not slot.exists:
+        try:
+            rc0 = lib.parse_memory(num)
+        except FileNotFoundError:
             console.print(f"[yellow]Warning:[/yellow] memory {num:03d} does not exist, skipping")
             continue
-
-        rc0 = lib.parse_memory(num)
-        mem = Memory(rc0, registry)
-
-        for sec_name, fields in sections_data.items():
-            resolved = mem.section(sec_name)
-            if resolved is None:
+        # Templates hold raw tags, so no schema resolution is needed
+        sections = {
+            name: sec for element in rc0.elements for name, sec in element.sections.items()
+        }
+
+        # Only slots where some value actually differs are rewritten
+        dirty = False
+        for sec_name, items in plan:
+            sec = sections.get(sec_name)
+            if sec is None:
                 continue
-            for tag, value in fields.items():
-                if tag in resolved.raw.fields:
-                    resolved.raw[tag] = value
-
+            raw_fields = sec.fields
+            for tag, value in items:
+                if tag in raw_fields and raw_fields[tag] != value:
+                    raw_fields[tag] = value
+                    dirty = True
+
+        if not dirty:
+            unchanged += 1
+            continue
         if not dry_run:
             lib.save_memory(num, rc0)
+            _forget_memories(lib, num)
         applied += 1
 
     label = "[dim](dry-run)[/dim]" if dry_run else "[green]Applied[/green]"
+    note = f" ({unchanged} already matched)" if unchanged else ""
     console.print(
         f"{label} template ({len(sections_data)} section(s)) "
-        f"to {applied} memory slot(s)"
+        f"to {applied} memory slot(s){note}"
     )
 
 
@@ -1591,7 +2065,7 @@ def template_apply(
 @click.argument("section_name")
 @click.argument("param_name")
 @click.argument("value", type=int)
-@click.option("--dir", "-d", "roland_dir", type=click.Path(file_okay=False),
+@click.option("--dir", "-d", "roland_dir", type=str,
               default=None, help="ROLAND/ directory (default: config or auto-detect)")
 @click.option("--dry-run", "-n", is_flag=True, help="Show what would change without writing")
 def bulk_set(
@@ -1612,8 +2086,9 @@ def bulk_set(
       eastlight bulk-set 1-10 MASTER play_level 100
       eastlight bulk-set 1,3,5 TRACK1 pan 50
     """
+    console = _console()
     roland_dir = _resolve_dir(roland_dir)
-    lib = RC505Library(roland_dir)
+    lib = _library(roland_dir)
     registry = _load_registry()
 
     targets = _parse_memory_range(memory_nums)
@@ -1628,34 +2103,56 @@ def bulk_set(
 
     _validate_warn(schema, tag, value)
 
-    updated = 0
+    updated = unchanged = 0
+    checked = False
     for num in targets:
-        slot = lib.memory_slot(num)
-        if not slot.exists:
+        try:
+            rc0 = lib.parse_memory(num)
+        except FileNotFoundError:
             continue
-
-        rc0 = lib.parse_memory(num)
-        mem = Memory(rc0, registry)
-        resolved = mem.section(section_name)
-        if resolved is None:
+        # Later elements win, as in Memory.section (SETUP is in ifx and tfx)
+        sec = next(
+            (
+                el.sections[section_name]
+                for el in reversed(rc0.elements)
+                if section_name in el.sections
+            ),
+            None,
+        )
+        if not checked:
+            # Every memory has the same layout: a typo shows up in the first one
+            if sec is None:
+                raise click.ClickException(
+                    f"Section '{section_name}' not found in memory {num:03d}."
+                )
+            if tag not in sec.fields:
+                raise click.ClickException(
+                    f"Parameter '{param_name}' not found in {section_name}."
+                )
+            checked = True
+        if sec is None or tag not in sec.fields:
             continue
 
-        if tag in resolved.raw.fields:
-            old = resolved.raw.get(tag)
-            if dry_run:
-                console.print(
-                    f"  [dim](dry-run)[/dim] {num:03d}.{section_name}.{param_name}: "
-                    f"{old} → {value}"
-                )
-            else:
-                resolved.raw[tag] = value
-                lib.save_memory(num, rc0)
-            updated += 1
+        old = sec.fields[tag]
+        if old == value:
+            unchanged += 1
+            continue
+        if dry_run:
+            console.print(
+                f"  [dim](dry-run)[/dim] {num:03d}.{section_name}.{param_name}: "
+                f"{old} → {value}"
+            )
+        else:
+            sec.fields[tag] = value
+            lib.save_memory(num, rc0)
+            _forget_memories(lib, num)
+        updated += 1
 
     label = "[dim](dry-run)[/dim]" if dry_run else "[green]Set[/green]"
+    note = f" ({unchanged} already matched)" if unchanged else ""
     console.print(
         f"{label} {section_name}.{param_name} = {value} "
-        f"across {updated} memory slot(s)"
+        f"across {updated} memory slot(s){note}"
     )
 
 
@@ -1683,5 +2180,111 @@ def _parse_memory_range(spec: str) -> list[int]:
     return sorted(result)
 
 
+# --- Scripting commands ---
+
+
+def _run_script_line(line: str, where: str = "") -> bool:
+    """Run one command line in this process; return False if it failed.
+
+    Each line goes through the normal click entry point, so commands
+    behave exactly as on the shell, but share the already-imported
+    modules and the cached schema registry.
+    """
+    import shlex
+
+    try:
+        args = shlex.split(line, comments=True)
+    except ValueError as e:
+        click.echo(f"Error: {where}{e}", err=True)
+        return False
+    if not args:
+        return True
+    if args[0] in ("batch", "repl"):
+        click.echo(f"Error: {where}'{args[0]}' cannot be nested", err=True)
+        return False
+
+    try:
+        rv = cli.main(args=args, prog_name="eastlight", standalone_mode=False)
+    except click.ClickException as e:
+        click.echo(f"Error: {where}{e.format_message()}", err=True)
+        return False
+    except click.Abort:
+        click.echo(f"Aborted: {where}{line.strip()}", err=True)
+        return False
+    except Exception as e:  # e.g. FileNotFoundError, ValueError from the core
+        click.echo(f"Error: {where}{e or type(e).__name__}", err=True)
+        return False
+    # --help and ctx.exit() come back as an exit code
+    return rv in (None, 0)
+
+
+@cli.command("batch")
+@click.argument("script", type=click.File("r", encoding="utf-8"))
+@click.option("--keep-going", "-k", is_flag=True, help="Continue after a failing line")
+def batch_cmd(script: TextIO, keep_going: bool) -> None:
+    """Run commands from a file, one per line, in a single process.
+
+    Python start-up and schema loading are paid once instead of per
+    command. Lines use shell quoting; blank lines and '#' comments are
+    skipped. Use '-' to read from stdin. Stops at the first failing
+    line unless --keep-going is given.
+
+    Example file:
+
+    \b
+      name 1 "Intro"
+      set 1 TRACK1 pan 75
+      copy 1 2
+    """
+    failed = 0
+    for lineno, line in enumerate(script, 1):
+        if not _run_script_line(line, f"line {lineno}: "):
+            failed += 1
+            if not keep_going:
+                break
+    if failed:
+        raise click.ClickException(f"{failed} command(s) failed")
+
+
+@cli.command()
+def repl() -> None:
+    """Read and run commands interactively in a single process.
+
+    Type commands without the leading 'eastlight' (e.g. 'show 1 -s
+    MASTER'). Command names complete with Tab where readline is
+    available. Exit with 'quit', 'exit' or Ctrl-D.
+    """
+    try:
+        import readline
+    except ImportError:  # Windows without pyreadline
+        readline = None
+
+    if readline is not None:
+        names = sorted(cli.commands)
+
+        def complete(text: str, state: int) -> str | None:
+            matches = [n for n in names if n.startswith(text)]
+            return matches[state] if state < len(matches) else None
+
+        readline.set_completer(complete)
+        readline.parse_and_bind("tab: complete")
+
+    while True:
+        try:
+            line = input("eastlight> ")
+        except EOFError:
+            click.echo()
+            break
+        except KeyboardInterrupt:
+            click.echo()
+            continue
+        if line.strip() in ("quit", "exit"):
+            break
+        try:
+            _run_script_line(line)
+        except KeyboardInterrupt:  # Ctrl-C outside click's own handling
+            click.echo()
+
+
 if __name__ == "__main__":
     cli()
@@ -6,14 +6,18 @@ and scanning mounted volumes for ROLAND/ directory structures.
 
 from __future__ import annotations
 
+import json
+import os
 import platform
-from dataclasses import dataclass, field
+import time
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
-import yaml
-
 _CONFIG_DIR = Path.home() / ".config" / "eastlight"
 _CONFIG_FILE = _CONFIG_DIR / "config.yaml"
+_DETECT_CACHE_FILE = Path.home() / ".cache" / "eastlight" / "detected.json"
+_DETECT_CACHE_TTL = 60.0  # seconds
+_DETECT_WORKERS = 8  # threads for scanning several mount roots
 
 
 @dataclass
@@ -25,20 +29,37 @@ class Config:
     recent: list[str] = field(default_factory=list)  # Recently used ROLAND/ paths
 
 
+# Parsed config files: path → ((mtime_ns, size, inode), Config)
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int, int], Config]] = {}
+
+
 def load_config(path: Path | None = None) -> Config:
-    """Load config from YAML file, or return defaults if not found."""
+    """Load config from YAML file, or return defaults if not found.
+
+    The parse is reused while the file's mtime, size and inode are
+    unchanged; each call returns its own copy, so callers may modify it.
+    """
     path = path or _CONFIG_FILE
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return Config()
+    sig = (st.st_mtime_ns, st.st_size, st.st_ino)
 
-    with open(path) as f:
-        raw = yaml.safe_load(f) or {}
+    cached = _CONFIG_CACHE.get(path)
+    if cached is None or cached[0] != sig:
+        import yaml
 
-    return Config(
-        roland_dir=raw.get("roland_dir"),
-        backup=raw.get("backup", True),
-        recent=raw.get("recent", []),
-    )
+        with open(path, "rb") as f:
+            raw = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
+
+        cached = _CONFIG_CACHE[path] = sig, Config(
+            roland_dir=raw.get("roland_dir"),
+            backup=raw.get("backup", True),
+            recent=raw.get("recent", []),
+        )
+    cfg = cached[1]
+    return replace(cfg, recent=list(cfg.recent))
 
 
 def save_config(config: Config, path: Path | None = None) -> Path:
@@ -54,9 +75,15 @@ def save_config(config: Config, path: Path | None = None) -> Path:
     if config.recent:
         data["recent"] = config.recent
 
+    import yaml
+
     with open(path, "w") as f:
-        yaml.safe_dump(data, f, default_flow_style=False)
+        yaml.dump(
+            data, f, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+            default_flow_style=False,
+        )
 
+    _CONFIG_CACHE.pop(path, None)
     return path
 
 
@@ -76,15 +103,14 @@ def resolve_roland_dir(
     """
     if explicit:
         path = Path(explicit)
-        if not path.exists():
+        if not path.is_dir():
             raise ValueError(f"Directory not found: {path}")
         return path
 
+    # A usable configured directory skips the mount scan entirely
     cfg = load_config(config_path)
-    if cfg.roland_dir:
-        path = Path(cfg.roland_dir)
-        if path.exists():
-            return path
+    if cfg.roland_dir and os.path.isdir(cfg.roland_dir):
+        return Path(cfg.roland_dir)
 
     devices = detect_device()
     if len(devices) == 1:
@@ -104,63 +130,133 @@ def resolve_roland_dir(
 
 
 def _is_roland_dir(path: Path) -> bool:
-    """Check if a path looks like a valid RC-505 MK2 ROLAND/ directory."""
-    return (
-        path.is_dir()
-        and (path / "DATA").is_dir()
-        and any((path / "DATA").glob("MEMORY*A.RC0"))
-    )
+    """Check if a path looks like a valid RC-505 MK2 ROLAND/ directory.
+
+    A single scandir of DATA/ stops at the first memory file, instead of
+    stat'ing the directories and globbing every entry.
+    """
+    try:
+        with os.scandir(os.path.join(path, "DATA")) as it:
+            return any(
+                entry.name.startswith("MEMORY") and entry.name.endswith("A.RC0")
+                for entry in it
+            )
+    except OSError:  # missing, not a directory, or unreadable
+        return False
 
 
 def detect_device() -> list[Path]:
     """Scan common mount points for connected RC-505 MK2 devices.
 
     Returns a list of paths to ROLAND/ directories found on mounted volumes.
+
+    Results are cached on disk for a short time, keyed by the mount
+    directories and their mtimes (which change when a volume is mounted
+    or unmounted). Cached paths are re-checked before being returned.
     """
-    candidates: list[Path] = []
+    roots = _scan_roots()
+    stamp = [[root, _mtime_ns(root)] for root, _ in roots]
+
+    cached = _load_detect_cache(stamp)
+    if cached is not None and all(_is_roland_dir(p) for p in cached):
+        return cached
+
+    if len(roots) > 1:
+        # Each mount is scanned on its own thread: on removable media the
+        # scan is stat latency, which overlaps across devices
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(len(roots), _DETECT_WORKERS)) as pool:
+            found = list(pool.map(_scan_root, roots))
+    else:
+        found = [_scan_root(root) for root in roots]
+
+    candidates = [path for paths in found for path in paths]
+    _save_detect_cache(stamp, candidates)
+    return candidates
+
+
+def _scan_root(root: tuple[str, int]) -> list[Path]:
+    """Scan one (directory, depth) root; results keep scan order."""
+    found: list[Path] = []
+    _scan_for_roland(root[0], found, root[1])
+    return found
+
+
+def _scan_roots() -> list[tuple[str, int]]:
+    """List the (directory, depth) pairs to scan for ROLAND/ on this platform."""
     system = platform.system()
 
     if system == "Linux":
-        # Standard mount points for removable media
-        for base in [Path("/media"), Path("/mnt"), Path("/run/media")]:
-            if base.exists():
-                # /media/USER/VOLUME/ROLAND or /media/VOLUME/ROLAND
-                for child in _safe_iterdir(base):
-                    if child.is_dir():
-                        _scan_for_roland(child, candidates, depth=2)
-
-    elif system == "Darwin":
-        volumes = Path("/Volumes")
-        if volumes.exists():
-            for child in _safe_iterdir(volumes):
-                _scan_for_roland(child, candidates, depth=1)
-
-    elif system == "Windows":
+        # /media/USER/VOLUME/ROLAND or /media/VOLUME/ROLAND
+        return [
+            (entry.path, 2)
+            for base in ("/media", "/mnt", "/run/media")
+            for entry in _safe_scandir(base)
+            if entry.is_dir()
+        ]
+
+    if system == "Darwin":
+        return [(entry.path, 1) for entry in _safe_scandir("/Volumes")]
+
+    if system == "Windows":
         # Scan drive letters D: through Z:
-        for letter in "DEFGHIJKLMNOPQRSTUVWXYZ":
-            drive = Path(f"{letter}:\\")
-            if drive.exists():
-                _scan_for_roland(drive, candidates, depth=1)
+        drives = (f"{letter}:\\" for letter in "DEFGHIJKLMNOPQRSTUVWXYZ")
+        return [(drive, 1) for drive in drives if os.path.exists(drive)]
 
-    return candidates
+    return []
+
+
+def _mtime_ns(path: str) -> int:
+    """Return a directory's mtime, or -1 if it cannot be stat'ed."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _load_detect_cache(stamp: list[list]) -> list[Path] | None:
+    """Return cached detection results if fresh and taken for ``stamp``."""
+    try:
+        with open(_DETECT_CACHE_FILE, encoding="utf-8") as f:
+            raw = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(raw, dict) or raw.get("stamp") != stamp:
+        return None
+    if not 0 <= time.time() - raw.get("time", 0) <= _DETECT_CACHE_TTL:
+        return None
+    return [Path(p) for p in raw.get("devices", [])]
+
+
+def _save_detect_cache(stamp: list[list], devices: list[Path]) -> None:
+    """Best-effort write of detection results to the disk cache."""
+    data = {"stamp": stamp, "time": time.time(), "devices": [str(p) for p in devices]}
+    try:
+        _DETECT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(_DETECT_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+    except OSError:
+        pass
 
 
-def _safe_iterdir(path: Path) -> list[Path]:
-    """List directory contents, returning empty list on permission errors."""
+def _safe_scandir(path: str) -> list[os.DirEntry]:
+    """List directory entries, returning empty list if unreadable or missing."""
     try:
-        return list(path.iterdir())
-    except PermissionError:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
         return []
 
 
-def _scan_for_roland(base: Path, results: list[Path], depth: int) -> None:
+def _scan_for_roland(base: str, results: list[Path], depth: int) -> None:
     """Recursively scan for ROLAND/ directories up to a given depth."""
-    roland = base / "ROLAND"
+    roland = Path(base, "ROLAND")
     if _is_roland_dir(roland):
         results.append(roland)
         return
 
     if depth > 0:
-        for child in _safe_iterdir(base):
-            if child.is_dir() and not child.name.startswith("."):
-                _scan_for_roland(child, results, depth - 1)
+        for entry in _safe_scandir(base):
+            if entry.is_dir(follow_symlinks=False) and not entry.name.startswith("."):
+                _scan_for_roland(entry.path, results, depth - 1)
@@ -6,16 +6,31 @@ within a Roland RC-505 MK2 backup directory structure.
 
 from __future__ import annotations
 
+import filecmp
 import hashlib
+import os
 import shutil
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
-from .parser import RC0File, parse_memory_file, parse_system_file
+from .parser import RC0File, RC0Section, parse_memory_file, parse_system_file
 from .writer import write_rc0
 
 _BACKUP_BASE = Path.home() / ".config" / "eastlight" / "backups"
+_PRUNE_WORKERS = 4  # threads for deleting old backup snapshots
+
+_NAME_TAGS = "ABCDEFGHIJKL"
+
+# Sections and tags needed to summarize a memory for listing
+_TRACK_SECTIONS = ("TRACK1", "TRACK2", "TRACK3", "TRACK4", "TRACK5")
+_SUMMARY_SECTIONS = frozenset({"NAME", *_TRACK_SECTIONS})
+_SUMMARY_TAGS = frozenset(_NAME_TAGS) | {"U", "W"}  # U = tempo_x10, W = has_audio
+_PREFETCH_HEAD = 8192  # covers NAME..TRACK5 with room to spare
+_PREFETCH_TAIL = 4096  # the <count> trailer
 
 
 def backup_dir_for(roland_dir: Path) -> Path:
@@ -25,13 +40,21 @@ def backup_dir_for(roland_dir: Path) -> Path:
     where <hash> is derived from the resolved ROLAND directory path.
     This keeps backups outside the device filesystem.
     """
-    path_hash = hashlib.sha256(str(roland_dir.resolve()).encode()).hexdigest()[:12]
-    return _BACKUP_BASE / path_hash
+    return _BACKUP_BASE / _path_hash(str(roland_dir.resolve()))
 
 
-@dataclass
+@lru_cache(maxsize=32)
+def _path_hash(resolved: str) -> str:
+    return hashlib.sha256(resolved.encode()).hexdigest()[:12]
+
+
+@dataclass(slots=True)
 class MemorySlot:
-    """A memory slot (1-99) with its A/B file paths and WAV track paths."""
+    """A memory slot (1-99) with its A/B file paths and WAV track paths.
+
+    Paths are None for files that did not exist when the slot was listed;
+    the properties below report that snapshot without touching the disk.
+    """
 
     number: int  # 1-99
     a_path: Path | None  # MEMORY001A.RC0
@@ -40,11 +63,11 @@ class MemorySlot:
 
     @property
     def exists(self) -> bool:
-        return self.a_path is not None and self.a_path.exists()
+        return self.a_path is not None
 
     @property
     def has_backup(self) -> bool:
-        return self.b_path is not None and self.b_path.exists()
+        return self.b_path is not None
 
     @property
     def has_audio(self) -> bool:
@@ -55,6 +78,91 @@ class MemorySlot:
         return self.wav_paths.get(track)
 
 
+@dataclass
+class MemorySummary:
+    """The few fields of a memory needed for a library listing."""
+
+    number: int  # 1-99
+    name: str
+    track_flags: tuple[bool, ...]  # has_audio for tracks 1-5
+    tempo_x10: int  # tempo of the first track with audio, 0 if none
+    has_backup: bool
+
+
+def _decode_name(name_section: RC0Section) -> str:
+    """Decode a NAME section's 12 character codes into a display string."""
+    chars = []
+    for tag in _NAME_TAGS:
+        code = name_section.get(tag, 32)  # 32 = space
+        if code == 0:
+            break
+        chars.append(chr(code))
+    return "".join(chars).rstrip()
+
+
+def _snapshot_files(ts_dir: Path) -> list[Path]:
+    """List the files in a backup snapshot, relative to it, sorted.
+
+    os.walk classifies entries from the directory listing itself, where
+    Path.rglob + is_file() stats every entry again.
+    """
+    files = []
+    for root, _, names in os.walk(ts_dir):
+        rel_root = os.path.relpath(root, ts_dir)
+        for name in names:
+            files.append(Path(name) if rel_root == "." else Path(rel_root, name))
+    files.sort()
+    return files
+
+
+def _prefetch_summary_pages(paths: list[Path]) -> None:
+    """Ask the kernel to start reading the parts of each RC0 a summary touches.
+
+    A summary needs the head of the file (NAME, TRACK1-5) and the trailing
+    <count>. Hinting every file up front lets the reads for later slots
+    overlap the parsing of earlier ones on a cold cache. A no-op where
+    posix_fadvise is unavailable.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            size = os.fstat(fd).st_size
+            os.posix_fadvise(fd, 0, _PREFETCH_HEAD, os.POSIX_FADV_WILLNEED)
+            if size > _PREFETCH_HEAD:
+                tail = max(_PREFETCH_HEAD, size - _PREFETCH_TAIL)
+                os.posix_fadvise(fd, tail, size - tail, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _split_element_ids(data: bytes) -> list[bytes]:
+    """Split RC0 bytes around the slot-specific id="..." of mem/ifx/tfx.
+
+    Two memories whose pieces are equal hold the same content in
+    different slots (e.g. after a copy).
+    """
+    pieces = []
+    pos = 0
+    for opener in (b'<mem id="', b'<ifx id="', b'<tfx id="'):
+        start = data.find(opener, pos)
+        if start < 0:
+            continue
+        start += len(opener)
+        pieces.append(data[pos:start])
+        pos = data.find(b'"', start)
+        if pos < 0:
+            pos = start
+    pieces.append(data[pos:])
+    return pieces
+
+
 class RC505Library:
     """Manager for a ROLAND/ backup directory.
 
@@ -80,6 +188,8 @@ class RC505Library:
         self.wave_dir = self.root / "WAVE"
         self._backup = backup
         self._backup_dir = backup_dir or backup_dir_for(self.root)
+        # slot number → ((mtime_ns, size) of the A file, decoded name)
+        self._name_cache: dict[int, tuple[tuple[int, int], str]] = {}
 
         if not self.data_dir.exists():
             raise FileNotFoundError(f"DATA directory not found: {self.data_dir}")
@@ -88,6 +198,10 @@ class RC505Library:
         """Create a timestamped backup of a file before overwriting it.
 
         Returns the backup path, or None if backup is disabled or file doesn't exist.
+
+        If the file is byte-identical to its most recent backup, the new
+        snapshot gets a hard link to that copy instead of a second copy.
+        Backup files are never modified in place, so sharing one is safe.
         """
         if not self._backup or not path.exists():
             return None
@@ -95,36 +209,149 @@ class RC505Library:
         ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
         rel = path.relative_to(self.root)
         backup_path = self._backup_dir / ts / rel
+        if backup_path.exists():
+            return backup_path  # already in this snapshot; keep the earlier state
         backup_path.parent.mkdir(parents=True, exist_ok=True)
+
+        previous = self._latest_backup_of(rel, before=ts)
+        if previous is not None and filecmp.cmp(previous, path, shallow=False):
+            try:
+                os.link(previous, backup_path)
+                return backup_path
+            except OSError:
+                pass  # no hard links on this filesystem — copy instead
         shutil.copy2(path, backup_path)
         return backup_path
 
+    def _latest_backup_of(self, rel: Path, *, before: str) -> Path | None:
+        """Return the newest existing backup of ``rel`` older than snapshot ``before``."""
+        try:
+            snapshots = sorted(os.listdir(self._backup_dir), reverse=True)
+        except OSError:
+            return None
+        for name in snapshots:
+            if name >= before:
+                continue
+            candidate = self._backup_dir / name / rel
+            if candidate.is_file():
+                return candidate
+        return None
+
     def memory_slot(self, number: int) -> MemorySlot:
         """Get a memory slot by number (1-99)."""
         if not 1 <= number <= 99:
             raise ValueError(f"Memory number must be 1-99, got {number}")
 
+        data_dir = os.fspath(self.data_dir)
+        wave_dir = os.fspath(self.wave_dir)
         prefix = f"MEMORY{number:03d}"
-        a_path = self.data_dir / f"{prefix}A.RC0"
-        b_path = self.data_dir / f"{prefix}B.RC0"
+        a_path = os.path.join(data_dir, f"{prefix}A.RC0")
+        b_path = os.path.join(data_dir, f"{prefix}B.RC0")
 
         wav_paths = {}
         for track in range(1, 6):
-            wav_dir = self.wave_dir / f"{number:03d}_{track}"
-            wav_file = wav_dir / f"{number:03d}_{track}.WAV"
-            if wav_file.exists():
-                wav_paths[track] = wav_file
+            track_dir = f"{number:03d}_{track}"
+            wav_file = os.path.join(wave_dir, track_dir, f"{track_dir}.WAV")
+            if os.path.exists(wav_file):
+                wav_paths[track] = Path(wav_file)
 
         return MemorySlot(
             number=number,
-            a_path=a_path if a_path.exists() else None,
-            b_path=b_path if b_path.exists() else None,
+            a_path=Path(a_path) if os.path.exists(a_path) else None,
+            b_path=Path(b_path) if os.path.exists(b_path) else None,
             wav_paths=wav_paths,
         )
 
+    def track_wav_path(self, number: int, track: int) -> Path:
+        """Device path of a track's audio, WAVE/NNN_T/NNN_T.WAV (may not exist)."""
+        track_dir = f"{number:03d}_{track}"
+        return self.wave_dir / track_dir / f"{track_dir}.WAV"
+
     def list_memories(self) -> list[MemorySlot]:
-        """List all 99 memory slots."""
-        return [self.memory_slot(n) for n in range(1, 100)]
+        """List all 99 memory slots.
+
+        DATA/ and WAVE/ are each listed once and the slots are built from
+        those listings, instead of stat-ing ~700 candidate paths.
+        """
+        data_dir = os.fspath(self.data_dir)
+        wave_dir = os.fspath(self.wave_dir)
+        data_names = set(os.listdir(data_dir))
+        try:
+            wave_names = set(os.listdir(wave_dir))
+        except FileNotFoundError:
+            wave_names = set()
+
+        slots = []
+        for number in range(1, 100):
+            prefix = f"MEMORY{number:03d}"
+            a_name = f"{prefix}A.RC0"
+            b_name = f"{prefix}B.RC0"
+
+            wav_paths = {}
+            for track in range(1, 6):
+                track_dir = f"{number:03d}_{track}"
+                if track_dir not in wave_names:
+                    continue
+                wav_file = os.path.join(wave_dir, track_dir, f"{track_dir}.WAV")
+                if os.path.isfile(wav_file):
+                    wav_paths[track] = Path(wav_file)
+
+            slots.append(MemorySlot(
+                number=number,
+                a_path=Path(data_dir, a_name) if a_name in data_names else None,
+                b_path=Path(data_dir, b_name) if b_name in data_names else None,
+                wav_paths=wav_paths,
+            ))
+        return slots
+
+    def memory_summary(self, slot: MemorySlot) -> MemorySummary:
+        """Summarize an existing memory slot from a partial parse of its RC0.
+
+        Only the NAME and TRACK1-5 sections are parsed, and scanning stops
+        once they have been read, so this touches a few KB per file.
+        """
+        rc0 = parse_memory_file(
+            slot.a_path, only_sections=_SUMMARY_SECTIONS, only_tags=_SUMMARY_TAGS
+        )
+        mem = rc0.mem
+        name = _decode_name(mem["NAME"]) if "NAME" in mem else ""
+
+        sections = mem.sections
+        flags = []
+        tempo_x10 = 0
+        for sec_name in _TRACK_SECTIONS:
+            track = sections.get(sec_name)
+            fields = track.fields if track is not None else {}
+            has_audio = fields.get("W") == 1
+            flags.append(has_audio)
+            if has_audio and not tempo_x10:
+                tempo_x10 = fields.get("U", 0)
+
+        return MemorySummary(
+            number=slot.number,
+            name=name,
+            track_flags=tuple(flags),
+            tempo_x10=tempo_x10,
+            has_backup=slot.has_backup,
+        )
+
+    def list_memories_summary(self, workers: int = 1) -> list[MemorySummary]:
+        """Summarize every existing memory slot (see memory_summary).
+
+        With ``workers > 1`` the slots are read on a thread pool. A warm
+        partial parse is only ~0.25 ms per slot, so this only pays off on
+        slow media (SD cards, network mounts) where threads can overlap
+        page faults; results keep slot order either way.
+        """
+        slots = [slot for slot in self.list_memories() if slot.exists]
+        if workers <= 1:
+            _prefetch_summary_pages([slot.a_path for slot in slots])
+            return [self.memory_summary(slot) for slot in slots]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.memory_summary, slots))
 
     def parse_memory(self, number: int, variant: str = "A") -> RC0File:
         """Parse a memory file."""
@@ -143,8 +370,24 @@ class RC505Library:
         path = self.data_dir / f"MEMORY{number:03d}{variant}.RC0"
         self._backup_file(path)
         write_rc0(rc0, path)
+        self._name_cache.pop(number, None)
         return path
 
+    @contextmanager
+    def transaction(
+        self, number: int, variant: str = "A", *, commit: bool = True
+    ) -> Iterator[RC0File]:
+        """Parse a memory once, yield it for editing, then save it once.
+
+        Any number of edits made inside the ``with`` block cost a single
+        parse and a single write. If the block raises, nothing is written.
+        With ``commit=False`` (dry runs) the file is never written.
+        """
+        rc0 = self.parse_memory(number, variant)
+        yield rc0
+        if commit:
+            self.save_memory(number, rc0, variant)
+
     def copy_memory(self, src: int, dst: int) -> None:
         """Copy a memory slot to another slot (RC0 data + WAV audio).
 
@@ -175,11 +418,10 @@ class RC505Library:
 
         # Copy WAV files
         for track in range(1, 6):
-            src_wav = self.wave_dir / f"{src:03d}_{track}" / f"{src:03d}_{track}.WAV"
+            src_wav = self.track_wav_path(src, track)
             if src_wav.exists():
-                dst_wav_dir = self.wave_dir / f"{dst:03d}_{track}"
-                dst_wav_dir.mkdir(parents=True, exist_ok=True)
-                dst_wav = dst_wav_dir / f"{dst:03d}_{track}.WAV"
+                dst_wav = self.track_wav_path(dst, track)
+                dst_wav.parent.mkdir(parents=True, exist_ok=True)
                 self._backup_file(dst_wav)
                 shutil.copy2(src_wav, dst_wav)
 
@@ -206,44 +448,31 @@ class RC505Library:
         self.save_memory(b, rc0_a)
         self.save_memory(a, rc0_b)
 
-        # Swap WAV files via temp directory
-        tmp_dir = self.wave_dir / "__swap_tmp"
-        try:
-            for track in range(1, 6):
-                wav_a = self.wave_dir / f"{a:03d}_{track}" / f"{a:03d}_{track}.WAV"
-                wav_b = self.wave_dir / f"{b:03d}_{track}" / f"{b:03d}_{track}.WAV"
-                a_exists = wav_a.exists()
-                b_exists = wav_b.exists()
-
-                # Backup before swap
-                if a_exists:
-                    self._backup_file(wav_a)
-                if b_exists:
-                    self._backup_file(wav_b)
-
-                if not a_exists and not b_exists:
-                    continue
-
-                if a_exists:
-                    tmp_track = tmp_dir / f"_{track}"
-                    tmp_track.mkdir(parents=True, exist_ok=True)
-                    shutil.move(str(wav_a), str(tmp_track / "tmp.WAV"))
-
-                if b_exists:
-                    dst_dir_a = self.wave_dir / f"{a:03d}_{track}"
-                    dst_dir_a.mkdir(parents=True, exist_ok=True)
-                    shutil.move(str(wav_b), str(dst_dir_a / f"{a:03d}_{track}.WAV"))
-
-                if a_exists:
-                    dst_dir_b = self.wave_dir / f"{b:03d}_{track}"
-                    dst_dir_b.mkdir(parents=True, exist_ok=True)
-                    shutil.move(
-                        str(tmp_dir / f"_{track}" / "tmp.WAV"),
-                        str(dst_dir_b / f"{b:03d}_{track}.WAV"),
-                    )
-        finally:
-            if tmp_dir.exists():
-                shutil.rmtree(tmp_dir)
+        # Swap WAV files with plain renames: everything stays under WAVE/,
+        # so each move is a metadata update, never a copy
+        for track in range(1, 6):
+            wav_a = self.track_wav_path(a, track)
+            wav_b = self.track_wav_path(b, track)
+            a_exists = wav_a.exists()
+            b_exists = wav_b.exists()
+
+            # Backup before swap
+            if a_exists:
+                self._backup_file(wav_a)
+            if b_exists:
+                self._backup_file(wav_b)
+
+            if a_exists and b_exists:
+                tmp = wav_a.with_name(".eastlight_swap.WAV")
+                os.rename(wav_a, tmp)
+                os.rename(wav_b, wav_a)
+                os.rename(tmp, wav_b)
+            elif a_exists:
+                wav_b.parent.mkdir(exist_ok=True)
+                os.rename(wav_a, wav_b)
+            elif b_exists:
+                wav_a.parent.mkdir(exist_ok=True)
+                os.rename(wav_b, wav_a)
 
     def parse_system(self, variant: int = 1) -> RC0File:
         """Parse a system file."""
@@ -280,11 +509,12 @@ class RC505Library:
             if path.exists():
                 self._backup_file(path)
                 path.unlink()
+        self._name_cache.pop(number, None)
 
         # Backup and remove WAV files/directories
         for track in range(1, 6):
-            wav_dir = self.wave_dir / f"{number:03d}_{track}"
-            wav_file = wav_dir / f"{number:03d}_{track}.WAV"
+            wav_file = self.track_wav_path(number, track)
+            wav_dir = wav_file.parent
             if wav_file.exists():
                 self._backup_file(wav_file)
                 wav_file.unlink()
@@ -304,10 +534,7 @@ class RC505Library:
         for ts_dir in sorted(self._backup_dir.iterdir(), reverse=True):
             if not ts_dir.is_dir():
                 continue
-            files = sorted(
-                p.relative_to(ts_dir) for p in ts_dir.rglob("*") if p.is_file()
-            )
-            result.append((ts_dir.name, files))
+            result.append((ts_dir.name, _snapshot_files(ts_dir)))
         return result
 
     def restore_backup(self, timestamp: str) -> list[Path]:
@@ -319,15 +546,13 @@ class RC505Library:
         if not ts_dir.exists():
             raise FileNotFoundError(f"Backup '{timestamp}' not found")
 
-        restored = []
-        for backup_file in ts_dir.rglob("*"):
-            if not backup_file.is_file():
-                continue
-            rel = backup_file.relative_to(ts_dir)
+        restored = _snapshot_files(ts_dir)
+        for rel in restored:
             dest = self.root / rel
             dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(backup_file, dest)
-            restored.append(rel)
+            shutil.copy2(ts_dir / rel, dest)
+        # copy2 brings back the backup's mtime, which the name cache can't detect
+        self._name_cache.clear()
         return restored
 
     def prune_backups(self, keep: int = 5) -> int:
@@ -338,28 +563,49 @@ class RC505Library:
         if not self._backup_dir.exists():
             return 0
 
-        snapshots = sorted(
-            (d for d in self._backup_dir.iterdir() if d.is_dir()),
-            reverse=True,
-        )
+        with os.scandir(self._backup_dir) as it:
+            snapshots = sorted((e.path for e in it if e.is_dir()), reverse=True)
         to_delete = snapshots[keep:]
-        for d in to_delete:
-            shutil.rmtree(d)
+        if len(to_delete) > 1:
+            # Snapshots are independent trees, so remove them concurrently
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(
+                max_workers=min(len(to_delete), _PRUNE_WORKERS)
+            ) as pool:
+                list(pool.map(shutil.rmtree, to_delete))
+        else:
+            for d in to_delete:
+                shutil.rmtree(d)
         return len(to_delete)
 
     def memory_name(self, number: int) -> str:
-        """Read the display name of a memory slot."""
-        rc0 = self.parse_memory(number)
+        """Read the display name of a memory slot.
+
+        Only the NAME section is parsed. Results are cached per slot and
+        reused while the file's mtime and size are unchanged.
+        """
+        path = self.data_dir / f"MEMORY{number:03d}A.RC0"
+        st = path.stat()
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = self._name_cache.get(number)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        rc0 = parse_memory_file(path, only_sections={"NAME"}, only_tags=_NAME_TAGS)
         mem = rc0.mem
-        if mem is None or "NAME" not in mem:
-            return ""
-
-        name_section = mem["NAME"]
-        chars = []
-        for tag in "ABCDEFGHIJKL":
-            code = name_section.get(tag, 32)  # 32 = space
-            if code == 0:
-                break
-            chars.append(chr(code))
-
-        return "".join(chars).rstrip()
+        name = _decode_name(mem["NAME"]) if "NAME" in mem else ""
+        self._name_cache[number] = (signature, name)
+        return name
+
+    def memories_identical(self, a: int, b: int) -> bool:
+        """Return True if two memories' A files match apart from their slot ids.
+
+        This is a byte comparison with no parsing, so a diff of a slot
+        against itself or against a fresh copy costs two file reads.
+        """
+        data_a = (self.data_dir / f"MEMORY{a:03d}A.RC0").read_bytes()
+        if a == b:
+            return True
+        data_b = (self.data_dir / f"MEMORY{b:03d}A.RC0").read_bytes()
+        return _split_element_ids(data_a) == _split_element_ids(data_b)
@@ -17,7 +17,7 @@ from .schema import SchemaRegistry, SectionSchema
 # --- Change tracking and undo/redo ---
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldChange:
     """Record of a single field value change (for undo/redo and observers)."""
 
@@ -79,7 +79,7 @@ class UndoStack:
 # --- Data model ---
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedSection:
     """A section with both raw tag access and schema-resolved named access."""
 
@@ -115,13 +115,13 @@ class ResolvedSection:
         """Set a parameter value by its human-readable name."""
         if self.schema is None:
             raise ValueError(f"No schema loaded for section {self.raw.name}")
-        tag = self.schema.name_to_tag(param_name)
-        if tag is None:
+        entry = self.schema.by_name.get(param_name)
+        if entry is None:
             raise KeyError(f"Unknown parameter '{param_name}' in {self.raw.name}")
-        fd = self.schema.fields.get(tag)
-        if fd and fd.read_only:
+        tag, fd = entry
+        if fd.read_only:
             raise ValueError(f"Parameter '{param_name}' is read-only")
-        if fd and fd.range is not None:
+        if fd.range is not None:
             lo, hi = fd.range
             if not lo <= value <= hi:
                 raise ValueError(
@@ -141,14 +141,15 @@ class ResolvedSection:
         """Return all fields as {name: value} dict using schema names."""
         if self.schema is None:
             return dict(self.raw.fields)
-        result = {}
-        for tag, value in self.raw.fields.items():
-            name = self.schema.tag_to_name(tag)
-            result[name or tag] = value
-        return result
+        tag_to_name = self.schema.tag_to_name
+        return {tag_to_name(tag) or tag: value for tag, value in self.raw.fields.items()}
 
     def get_by_tag(self, tag: str) -> int:
-        """Get raw value by positional tag."""
+        """Get raw value by positional tag.
+
+        For reading many tags in a loop, use ``self.raw.fields`` (a plain
+        dict) directly.
+        """
         return self.raw.get(tag)
 
     def set_by_tag(self, tag: str, value: int) -> None:
@@ -174,18 +175,6 @@ class Memory:
         self._resolved: dict[str, ResolvedSection] = {}
         self._undo_stack = UndoStack()
         self._dirty = False
-        self._resolve_all()
-
-    def _resolve_all(self) -> None:
-        """Resolve all sections against the schema registry."""
-        for element in self._rc0.elements:
-            for section_name, section in element.sections.items():
-                schema = self._registry.get(section_name)
-                self._resolved[section_name] = ResolvedSection(
-                    raw=section,
-                    schema=schema,
-                    _undo_stack=self._undo_stack,
-                )
 
     @property
     def rc0(self) -> RC0File:
@@ -225,8 +214,25 @@ class Memory:
             name_section.set_by_tag(tag, ord(padded[i]))
 
     def section(self, name: str) -> ResolvedSection | None:
-        """Get a resolved section by name."""
-        return self._resolved.get(name)
+        """Get a resolved section by name.
+
+        Sections are resolved against the schema on first access and cached,
+        so callers that read only a few sections don't pay for the rest.
+        """
+        resolved = self._resolved.get(name)
+        if resolved is not None:
+            return resolved
+        # A later element's section shadows an earlier one of the same name
+        for element in reversed(self._rc0.elements):
+            raw = element.sections.get(name)
+            if raw is not None:
+                resolved = self._resolved[name] = ResolvedSection(
+                    raw=raw,
+                    schema=self._registry.get(name),
+                    _undo_stack=self._undo_stack,
+                )
+                return resolved
+        return None
 
     def track(self, num: int) -> ResolvedSection | None:
         """Get TRACK1-TRACK6 section."""
@@ -235,7 +241,9 @@ class Memory:
     @property
     def section_names(self) -> list[str]:
         """All section names in this memory."""
-        return list(self._resolved.keys())
+        return list(dict.fromkeys(
+            name for element in self._rc0.elements for name in element.sections
+        ))
 
     def undo(self) -> FieldChange | None:
         """Undo the most recent change. Returns the change that was undone."""
@@ -243,7 +251,7 @@ class Memory:
         if change is None:
             return None
         # Apply the reverse without triggering another undo push
-        section = self._resolved.get(change.section_name)
+        section = self.section(change.section_name)
         if section:
             section.raw[change.tag] = change.old_value
         return change
@@ -253,7 +261,7 @@ class Memory:
         change = self._undo_stack.pop_redo()
         if change is None:
             return None
-        section = self._resolved.get(change.section_name)
+        section = self.section(change.section_name)
         if section:
             section.raw[change.tag] = change.new_value
         return change
@@ -7,14 +7,18 @@ so standard XML parsers cannot handle them. This module uses regex-based parsing
 
 from __future__ import annotations
 
+import functools
+import mmap
 import re
+from collections.abc import Collection
 from dataclasses import dataclass, field
 from pathlib import Path
 
-# Match top-level elements: <mem id="N">, <ifx id="N">, <tfx id="N">, <sys>
-_TOP_LEVEL_RE = re.compile(
-    r"<(mem|ifx|tfx|sys)(?:\s+id=\"(\d+)\")?>(.+?)</\1>",
-    re.DOTALL,
+# Match the opening tag of a top-level element: <mem id="N">, <ifx id="N">,
+# <tfx id="N">, <sys>. The matching close tag is located with str.find, which
+# is much cheaper than a lazy regex running across the whole element.
+_TOP_LEVEL_OPEN_RE = re.compile(
+    r"<(mem|ifx|tfx|sys)(?:\s+id=\"(\d+)\")?>",
 )
 
 # Match sections within a top-level element: <TRACK1>...</TRACK1>, <AA_LPF>...</AA_LPF>
@@ -31,6 +35,15 @@ _FIELD_RE = re.compile(
     r"<([^/][^>]*)>(-?\d+)</\1>",
 )
 
+# Tokenize a whole top-level element body in one pass. Each match is one
+# line: a section opening (<TRACK1>), a section closing (</TRACK1>), or a
+# field (<A>123</A>). Sections open and close on lines of their own, which is
+# what tells an FX group section <A> apart from its field <A>N</A>.
+_TOKEN_RE = re.compile(
+    r"^(?:<([A-Z][A-Z0-9_]*)>|</([A-Z][A-Z0-9_]*)>|[ \t]*<([^/>][^>]*)>(-?\d+)</\3>)$",
+    re.MULTILINE,
+)
+
 # Match the database header
 _DATABASE_RE = re.compile(
     r'<database\s+name="([^"]+)"\s+revision="(\d+)">'
@@ -41,8 +54,14 @@ _COUNT_RE = re.compile(
     r"<count>(\d+)</count>"
 )
 
+# Bytes variants for filtered parsing, which scans a memory-mapped file
+_TOP_LEVEL_OPEN_BRE = re.compile(_TOP_LEVEL_OPEN_RE.pattern.encode())
+_SECTION_BRE = re.compile(_SECTION_RE.pattern.encode(), re.DOTALL)
+_DATABASE_BRE = re.compile(_DATABASE_RE.pattern.encode())
+_COUNT_BRE = re.compile(_COUNT_RE.pattern.encode())
+
 
-@dataclass
+@dataclass(slots=True)
 class RC0Field:
     """A single field within a section (e.g., tag='A', value=50)."""
 
@@ -50,7 +69,7 @@ class RC0Field:
     value: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RC0Section:
     """A named section within a top-level element (e.g., TRACK1, AA_LPF)."""
 
@@ -67,7 +86,7 @@ class RC0Section:
         return self.fields.get(tag, default)
 
 
-@dataclass
+@dataclass(slots=True)
 class RC0TopLevel:
     """A top-level element: mem, ifx, tfx, or sys."""
 
@@ -86,7 +105,7 @@ class RC0TopLevel:
         return list(self.sections.keys())
 
 
-@dataclass
+@dataclass(slots=True)
 class RC0File:
     """A parsed RC0 file."""
 
@@ -117,26 +136,152 @@ class RC0File:
         return next((e for e in self.elements if e.element == "sys"), None)
 
 
-def parse_sections(body: str) -> dict[str, RC0Section]:
-    """Parse all sections from a top-level element body."""
+def _parse_fields(body: str, only_tags: Collection[str] | None = None) -> dict[str, int]:
+    """Parse the fields of one section body, optionally keeping only some tags."""
+    if only_tags is None:
+        return {tag: int(value) for tag, value in _FIELD_RE.findall(body)}
+    if not only_tags:
+        return {}
+    # Match just the wanted tags instead of tokenizing every field and
+    # filtering: a summary of NAME + TRACK1-5 then skips ~95% of the fields
+    field_re = _tags_field_re(frozenset(only_tags))
+    return {tag: int(value) for tag, value in field_re.findall(body)}
+
+
+@functools.lru_cache(maxsize=32)
+def _tags_field_re(tags: frozenset[str]) -> re.Pattern[str]:
+    """Compile a _FIELD_RE variant that only matches the given tags."""
+    alternation = "|".join(re.escape(tag) for tag in sorted(tags, key=len, reverse=True))
+    return re.compile(rf"<({alternation})>(-?\d+)</\1>")
+
+
+def parse_sections(
+    body: str, only_tags: Collection[str] | None = None
+) -> dict[str, RC0Section]:
+    """Parse all sections from a top-level element body.
+
+    A full parse tokenizes the body once with _TOKEN_RE instead of matching
+    each section and then re-scanning its body for fields. A section only
+    counts once its closing line has been seen.
+    """
     sections: dict[str, RC0Section] = {}
+    if only_tags is None:
+        name = fields = None
+        for open_name, close_name, tag, value in _TOKEN_RE.findall(body):
+            if tag:
+                if fields is not None:
+                    fields[tag] = int(value)
+            elif open_name:
+                name, fields = open_name, {}
+            else:
+                if close_name == name:
+                    sections[name] = RC0Section(name=name, fields=fields)
+                name = fields = None
+        return sections
+
     for match in _SECTION_RE.finditer(body):
         section_name = match.group(1)
-        section_body = match.group(2)
-        fields = {}
-        for field_match in _FIELD_RE.finditer(section_body):
-            tag = field_match.group(1)
-            value = int(field_match.group(2))
-            fields[tag] = value
-        sections[section_name] = RC0Section(name=section_name, fields=fields)
+        sections[section_name] = RC0Section(
+            name=section_name, fields=_parse_fields(match.group(2), only_tags)
+        )
     return sections
 
 
-def parse_rc0(path: str | Path) -> RC0File:
+def _parse_elements_filtered(
+    content: bytes | mmap.mmap,
+    only_sections: Collection[str],
+    only_tags: Collection[str] | None,
+) -> list[RC0TopLevel]:
+    """Parse only the named sections, stopping as soon as all have been seen.
+
+    Sections are found in file order, so asking for sections near the top of
+    the file (NAME, TRACK1...) touches only the first few KB of a memory.
+    """
+    remaining = set(only_sections)
+    elements = []
+    pos = 0
+    while remaining:
+        match = _TOP_LEVEL_OPEN_BRE.search(content, pos)
+        if match is None:
+            break
+        element_name = match.group(1).decode("ascii")
+        end = content.find(b"</%s>" % match.group(1), match.end())
+        if end < 0:
+            break
+        element = RC0TopLevel(
+            element=element_name,
+            id=int(match.group(2)) if match.group(2) else None,
+        )
+        for section_match in _SECTION_BRE.finditer(content, match.end(), end):
+            section_name = section_match.group(1).decode("ascii")
+            if section_name not in remaining:
+                continue
+            element.sections[section_name] = RC0Section(
+                name=section_name,
+                fields=_parse_fields(section_match.group(2).decode("utf-8"), only_tags),
+            )
+            remaining.discard(section_name)
+            if not remaining:
+                break
+        elements.append(element)
+        pos = end
+    return elements
+
+
+def _parse_rc0_filtered(
+    path: Path,
+    only_sections: Collection[str],
+    only_tags: Collection[str] | None,
+) -> RC0File:
+    """Filtered parse_rc0: memory-map the file and read only what is needed.
+
+    The header sits at the start and the count footer at the end, so with
+    the early stop in _parse_elements_filtered only a few pages of the file
+    are ever faulted in. Everything returned is decoded into Python objects,
+    so the mapping is closed before returning.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            raise ValueError(f"No <database> header found in {path}") from None
+
+    with mm:
+        header_match = _DATABASE_BRE.search(mm)
+        if not header_match:
+            raise ValueError(f"No <database> header found in {path}")
+        device_name = header_match.group(1).decode("utf-8")
+        revision = int(header_match.group(2))
+
+        count_pos = mm.rfind(b"<count>")
+        count_match = _COUNT_BRE.match(mm, count_pos) if count_pos >= 0 else None
+        count = int(count_match.group(1)) if count_match else 0
+
+        elements = _parse_elements_filtered(mm, only_sections, only_tags)
+
+    return RC0File(
+        path=path,
+        device_name=device_name,
+        revision=revision,
+        elements=elements,
+        count=count,
+    )
+
+
+def parse_rc0(
+    path: str | Path,
+    *,
+    only_sections: Collection[str] | None = None,
+    only_tags: Collection[str] | None = None,
+) -> RC0File:
     """Parse an RC0 file and return its structured representation.
 
     Args:
         path: Path to the RC0 file.
+        only_sections: If given, parse only these sections and stop scanning
+            once all of them have been found. The result is a partial view
+            of the file and must not be written back.
+        only_tags: If given, keep only these field tags in parsed sections.
 
     Returns:
         RC0File with all elements, sections, and fields parsed.
@@ -146,6 +291,9 @@ def parse_rc0(path: str | Path) -> RC0File:
         ValueError: If the file doesn't contain a valid database header.
     """
     path = Path(path)
+    if only_sections is not None:
+        return _parse_rc0_filtered(path, only_sections, only_tags)
+
     content = path.read_text(encoding="utf-8")
 
     # Parse database header
@@ -159,18 +307,22 @@ def parse_rc0(path: str | Path) -> RC0File:
     count_match = _COUNT_RE.search(content)
     count = int(count_match.group(1)) if count_match else 0
 
-    # Parse top-level elements
+    # Parse top-level elements, finding each closing tag with str.find
     elements = []
-    for match in _TOP_LEVEL_RE.finditer(content):
+    pos = 0
+    while (match := _TOP_LEVEL_OPEN_RE.search(content, pos)) is not None:
         element_name = match.group(1)
+        end = content.find(f"</{element_name}>", match.end())
+        if end < 0:
+            break
         element_id = int(match.group(2)) if match.group(2) else None
-        element_body = match.group(3)
-        sections = parse_sections(element_body)
+        sections = parse_sections(content[match.end():end], only_tags)
         elements.append(RC0TopLevel(
             element=element_name,
             id=element_id,
             sections=sections,
         ))
+        pos = end
 
     return RC0File(
         path=path,
@@ -181,14 +333,23 @@ def parse_rc0(path: str | Path) -> RC0File:
     )
 
 
-def parse_memory_file(path: str | Path) -> RC0File:
+def parse_memory_file(
+    path: str | Path,
+    *,
+    only_sections: Collection[str] | None = None,
+    only_tags: Collection[str] | None = None,
+) -> RC0File:
     """Parse a memory RC0 file (MEMORY001A.RC0 etc.).
 
     Convenience wrapper that validates the file contains mem, ifx, and tfx elements.
+    With ``only_sections`` (see parse_rc0) only the <mem> element is required,
+    since a filtered parse may stop before reaching <ifx> and <tfx>.
     """
-    rc0 = parse_rc0(path)
+    rc0 = parse_rc0(path, only_sections=only_sections, only_tags=only_tags)
     if rc0.mem is None:
         raise ValueError(f"Memory file {path} missing <mem> element")
+    if only_sections is not None:
+        return rc0
     if rc0.ifx is None:
         raise ValueError(f"Memory file {path} missing <ifx> element")
     if rc0.tfx is None:
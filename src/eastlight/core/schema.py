@@ -6,14 +6,21 @@ to named parameters with types, ranges, and display metadata.
 
 from __future__ import annotations
 
+import os
+import pickle
+import sys
+import tempfile
 from dataclasses import dataclass, field
+from functools import cached_property
 from importlib import resources
 from pathlib import Path
 
-import yaml
+from eastlight import __version__
 
+_CACHE_DIR = Path.home() / ".cache" / "eastlight"
 
-@dataclass
+
+@dataclass(slots=True)
 class FieldDef:
     """Definition of a single field within a section."""
 
@@ -44,16 +51,30 @@ class SectionSchema:
 
     def name_to_tag(self, name: str) -> str | None:
         """Resolve a parameter name to its positional tag."""
+        entry = self.by_name.get(name)
+        return entry[0] if entry else None
+
+    @cached_property
+    def by_name(self) -> dict[str, tuple[str, FieldDef]]:
+        """Parameter name → (tag, FieldDef), built once.
+
+        The first field wins if two share a name, matching tag order.
+        """
+        index: dict[str, tuple[str, FieldDef]] = {}
         for tag, fd in self.fields.items():
-            if fd.name == name:
-                return tag
-        return None
+            index.setdefault(fd.name, (tag, fd))
+        return index
 
     @property
     def field_names(self) -> list[str]:
         """All parameter names in tag order."""
         return [fd.name for fd in self.fields.values()]
 
+    @cached_property
+    def display_names(self) -> dict[str, str]:
+        """Tag → UI label (display, falling back to name), built once."""
+        return {tag: fd.display or fd.name for tag, fd in self.fields.items()}
+
 
 def _parse_field_def(tag: str, raw: dict) -> FieldDef:
     """Parse a single field definition from YAML."""
@@ -64,30 +85,39 @@ def _parse_field_def(tag: str, raw: dict) -> FieldDef:
     choices = raw.get("choices")
     if choices is not None:
         # YAML may parse int keys as ints already, but ensure consistency
-        choices = {int(k): str(v) for k, v in choices.items()}
+        choices = {int(k): sys.intern(str(v)) for k, v in choices.items()}
 
+    # Interned so the hundreds of repeated names/labels/units share one
+    # object each, here and in the pickled registry cache
     return FieldDef(
-        tag=tag,
-        name=raw["name"],
-        type=raw.get("type", "int"),
-        display=raw.get("display", raw["name"]),
+        tag=sys.intern(tag),
+        name=sys.intern(raw["name"]),
+        type=sys.intern(raw.get("type", "int")),
+        display=sys.intern(raw.get("display", raw["name"])),
         default=raw.get("default", 0),
         range=range_val,
         choices=choices,
-        unit=raw.get("unit", ""),
+        unit=sys.intern(raw.get("unit", "")),
         computed=raw.get("computed", False),
         read_only=raw.get("read_only", False),
     )
 
 
+def _yaml_safe_load(stream):
+    """yaml.safe_load, using libyaml's C loader when PyYAML was built with it."""
+    import yaml
+
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
 def load_schema_from_yaml(yaml_path: str | Path) -> SectionSchema:
     """Load a section schema from a YAML file."""
-    with open(yaml_path) as f:
-        raw = yaml.safe_load(f)
+    with open(yaml_path, "rb") as f:
+        raw = _yaml_safe_load(f)
 
     fields = {}
     for tag, field_raw in raw.get("fields", {}).items():
-        tag = str(tag)  # YAML may parse single letters as strings already
+        tag = sys.intern(str(tag))  # YAML may parse single letters as strings already
         fields[tag] = _parse_field_def(tag, field_raw)
 
     return SectionSchema(
@@ -122,11 +152,24 @@ class FXTypeEnum:
         """Get TFX type index from effect name."""
         return self._tfx_reverse.get(name.upper())
 
+    def types(self, chain: str) -> dict[int, str]:
+        """Get the index → name map for a chain ('ifx' or 'tfx')."""
+        return self.ifx_types if chain == "ifx" else self.tfx_types
+
+    def effect_name(self, chain: str, index: int) -> str:
+        """Get the effect name for a chain's type index.
+
+        Unmapped indices come back as "UNKNOWN(<index>)", which is also
+        the suffix of the (absent) effect section for that subslot.
+        """
+        name = self.types(chain).get(index)
+        return name if name is not None else f"UNKNOWN({index})"
+
 
 def load_fx_types(yaml_path: str | Path) -> FXTypeEnum:
     """Load FX type enum from a YAML file."""
-    with open(yaml_path) as f:
-        raw = yaml.safe_load(f)
+    with open(yaml_path, "rb") as f:
+        raw = _yaml_safe_load(f)
 
     enum = FXTypeEnum()
     for index, name in raw.get("ifx", {}).items():
@@ -152,16 +195,20 @@ class SchemaRegistry:
         self._instance_map: dict[str, SectionSchema] = {}  # "TRACK1" → track schema
         self._fx_effect_schemas: dict[str, SectionSchema] = {}  # "LPF" → effect schema
         self.fx_types: FXTypeEnum = FXTypeEnum()
+        # Memoized get() results, including misses; cleared on registration
+        self._lookup_cache: dict[str, SectionSchema | None] = {}
 
     def register(self, schema: SectionSchema) -> None:
         """Register a section schema."""
         self._schemas[schema.section] = schema
         for instance in schema.instances:
             self._instance_map[instance] = schema
+        self._lookup_cache.clear()
 
     def register_fx_effect(self, suffix: str, schema: SectionSchema) -> None:
         """Register an FX effect schema by suffix (e.g., 'LPF', 'DELAY')."""
         self._fx_effect_schemas[suffix.upper()] = schema
+        self._lookup_cache.clear()
 
     def get(self, section_name: str) -> SectionSchema | None:
         """Look up schema by section type, instance name, or FX suffix.
@@ -170,6 +217,15 @@ class SchemaRegistry:
         For FX effect sections like "AA_LPF", strips the subslot prefix and
         looks up the effect schema by suffix.
         """
+        try:
+            return self._lookup_cache[section_name]
+        except KeyError:
+            pass
+        result = self._lookup(section_name)
+        self._lookup_cache[section_name] = result
+        return result
+
+    def _lookup(self, section_name: str) -> SectionSchema | None:
         # Direct match first
         result = self._schemas.get(section_name) or self._instance_map.get(section_name)
         if result is not None:
@@ -200,12 +256,7 @@ class SchemaRegistry:
         Automatically loads FX effect schemas from effects/ subdirectory
         and fx_types.yaml if present.
         """
-        if schema_dir is None:
-            schema_dir = resources.files("eastlight") / "schema"
-        else:
-            schema_dir = Path(schema_dir)
-
-        schema_dir = Path(schema_dir)
+        schema_dir = _builtin_schema_dir() if schema_dir is None else Path(schema_dir)
 
         for yaml_file in sorted(schema_dir.glob("*.yaml")):
             if yaml_file.name == "fx_types.yaml":
@@ -221,3 +272,58 @@ class SchemaRegistry:
                 schema = load_schema_from_yaml(yaml_file)
                 # The schema section name IS the effect suffix (e.g., "LPF")
                 self.register_fx_effect(schema.section, schema)
+
+
+def _builtin_schema_dir() -> Path:
+    """Path to the package's built-in schema/ directory."""
+    return Path(resources.files("eastlight") / "schema")
+
+
+def _schema_stamp(schema_dir: Path) -> int:
+    """Newest modification time across the schema YAML files and this module.
+
+    Including this module means a change to the schema classes also
+    invalidates previously pickled registries.
+    """
+    paths = [Path(__file__), *schema_dir.glob("*.yaml"), *schema_dir.glob("effects/*.yaml")]
+    return max(p.stat().st_mtime_ns for p in paths)
+
+
+def load_cached_registry(cache_dir: str | Path | None = None) -> SchemaRegistry:
+    """Load the built-in schema registry, reusing a pickled copy when fresh.
+
+    The pickle lives under ~/.cache/eastlight/registry-<version>.pkl and is
+    rebuilt whenever any built-in schema file is newer than the cached copy.
+    A missing, stale, or unreadable cache silently falls back to parsing the
+    YAML files; failure to write the cache is not an error.
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else _CACHE_DIR
+    cache_path = cache_dir / f"registry-{__version__}.pkl"
+    schema_dir = _builtin_schema_dir()
+    stamp = _schema_stamp(schema_dir)
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, registry = pickle.load(f)
+        if cached_stamp == stamp and isinstance(registry, SchemaRegistry):
+            return registry
+    except Exception:
+        pass  # missing or unreadable cache — rebuild below
+
+    registry = SchemaRegistry()
+    registry.load_all(schema_dir)
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((stamp, registry), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass  # read-only home etc. — the cache is only an optimization
+
+    return registry
@@ -6,6 +6,7 @@ preserving tag order, line breaks, and the count footer.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from .parser import RC0File, RC0Section, RC0TopLevel
@@ -64,7 +65,28 @@ def write_rc0(rc0: RC0File, path: str | Path | None = None) -> str:
     content = "\n".join(lines)  # no trailing newline — matches device format
 
     if path is not None:
-        path = Path(path)
-        path.write_text(content, encoding="utf-8")
+        _atomic_write(Path(path), content.encode("utf-8"))
 
     return content
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` in one write plus a rename.
+
+    The bytes go to a sibling temp file and are flushed and fsynced before
+    the temp file is renamed over the target, so neither an interrupted save
+    nor pulling the card right after one leaves a truncated RC0 behind. A
+    buffered file either writes everything or raises (e.g. on a full card),
+    where a raw write may silently stop short. Writing bytes also keeps LF
+    line endings on every platform.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
@@ -6,6 +6,16 @@ from pathlib import Path
 
 import pytest
 
+from eastlight.core import config as config_mod
+from eastlight.core import schema as schema_mod
+
+
+@pytest.fixture(autouse=True)
+def _isolated_caches(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep on-disk caches out of the real home directory."""
+    monkeypatch.setattr(schema_mod, "_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(config_mod, "_DETECT_CACHE_FILE", tmp_path / "cache" / "detected.json")
+
 
 @pytest.fixture
 def fixtures_dir() -> Path:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import shutil
 from pathlib import Path
 
@@ -66,6 +67,21 @@ class TestListCommand:
         assert "Memory 1" in result.output
         assert "Loop 2" in result.output
 
+    def test_list_plain(self, runner: CliRunner, roland_dir: Path) -> None:
+        result = runner.invoke(cli, ["list", "-d", str(roland_dir), "--plain"])
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert lines[0].split() == ["#", "Name", "Tracks", "Tempo", "Backup"]
+        assert lines[1].split()[:3] == ["1", "Memory", "1"]
+        assert "Loop 2" in lines[2]
+
+    def test_list_json(self, runner: CliRunner, roland_dir: Path) -> None:
+        result = runner.invoke(cli, ["list", "-d", str(roland_dir), "--json"])
+        assert result.exit_code == 0
+        rows = json.loads(result.output)
+        assert [r["name"] for r in rows[:2]] == ["Memory 1", "Loop 2"]
+        assert rows[0]["tracks"][0] is True
+
     def test_list_nonexistent_dir(self, runner: CliRunner) -> None:
         result = runner.invoke(cli, ["list", "-d", "/nonexistent/path"])
         assert result.exit_code != 0
@@ -87,6 +103,74 @@ class TestShowCommand:
         result = runner.invoke(cli, ["show", "1", "-d", str(roland_dir), "--raw"])
         assert result.exit_code == 0
 
+    def test_show_json(self, runner: CliRunner, roland_dir: Path) -> None:
+        result = runner.invoke(
+            cli, ["show", "1", "-d", str(roland_dir), "-s", "TRACK1", "--json"]
+        )
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["name"] == "Memory 1"
+        assert list(data["sections"]) == ["TRACK1"]
+        assert all(isinstance(p["value"], int) for p in data["sections"]["TRACK1"])
+
+    def test_show_reuses_parse_until_file_changes(
+        self, runner: CliRunner, roland_dir: Path
+    ) -> None:
+        from eastlight.cli.main import _read_memory
+        from eastlight.core.library import RC505Library
+
+        lib = RC505Library(roland_dir)
+        assert _read_memory(lib, 1) is _read_memory(lib, 1)
+
+        def pan() -> int:
+            result = runner.invoke(
+                cli, ["show", "1", "-d", str(roland_dir), "-s", "TRACK1", "--json"]
+            )
+            params = json.loads(result.output)["sections"]["TRACK1"]
+            return next(p["value"] for p in params if p["tag"] == "C")
+
+        assert pan() == 50
+        runner.invoke(cli, ["set", "1", "TRACK1", "pan", "75", "-d", str(roland_dir)])
+        assert pan() == 75
+
+    def test_bulk_writes_evict_cached_parse(
+        self, runner: CliRunner, roland_dir: Path
+    ) -> None:
+        # The stat signature can't be trusted on FAT or after copy2 restores
+        # an old mtime, so commands that write memories evict them explicitly
+        from eastlight.cli.main import _MEMORY_CACHE
+
+        key = str(roland_dir / "DATA" / "MEMORY001A.RC0")
+        d = ["-d", str(roland_dir)]
+        for command in (
+            ["bulk-set", "1", "MASTER", "A", "80", *d],
+            ["swap", "1", "2", *d],
+            ["copy", "2", "1", "--force", *d],
+        ):
+            runner.invoke(cli, ["show", "1", *d])
+            assert key in _MEMORY_CACHE
+            result = runner.invoke(cli, command)
+            assert result.exit_code == 0, result.output
+            assert key not in _MEMORY_CACHE
+
+    def test_show_after_set_uses_saved_memory(
+        self, runner: CliRunner, roland_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from eastlight.core.library import RC505Library
+
+        runner.invoke(cli, ["set", "1", "TRACK1", "pan", "75", "-d", str(roland_dir)])
+
+        def no_parse(*args: object) -> None:
+            raise AssertionError("memory was re-parsed")
+
+        monkeypatch.setattr(RC505Library, "parse_memory", no_parse)
+        result = runner.invoke(
+            cli, ["show", "1", "-d", str(roland_dir), "-s", "TRACK1", "--json"]
+        )
+        assert result.exit_code == 0, result.output
+        params = json.loads(result.output)["sections"]["TRACK1"]
+        assert next(p["value"] for p in params if p["tag"] == "C") == 75
+
 
 class TestParseCommand:
     def test_parse_file(self, runner: CliRunner, roland_dir: Path) -> None:
@@ -136,6 +220,38 @@ class TestSetCommand:
         assert result.exit_code != 0
         assert "not found" in result.output
 
+    def test_set_many_from_stdin(self, runner: CliRunner, roland_dir: Path) -> None:
+        result = runner.invoke(
+            cli,
+            ["set-many", "1", "-d", str(roland_dir), "-e", "TRACK1:pan=75", "-f", "-"],
+            input="# comment\n\nTRACK1:C=60\n",
+        )
+        assert result.exit_code == 0
+        assert result.output.count("Set") == 2
+
+        rc0 = parse_memory_file(roland_dir / "DATA" / "MEMORY001A.RC0")
+        assert rc0.mem["TRACK1"]["C"] == 60  # later edits win
+
+    def test_set_many_failure_writes_nothing(
+        self, runner: CliRunner, roland_dir: Path
+    ) -> None:
+        path = roland_dir / "DATA" / "MEMORY001A.RC0"
+        before = path.read_bytes()
+        result = runner.invoke(cli, [
+            "set-many", "1", "-d", str(roland_dir),
+            "-e", "TRACK1:pan=75", "-e", "TRACK1:zzz_fake=1",
+        ])
+        assert result.exit_code != 0
+        assert "not found" in result.output
+        assert path.read_bytes() == before
+
+    def test_set_many_bad_spec(self, runner: CliRunner, roland_dir: Path) -> None:
+        result = runner.invoke(
+            cli, ["set-many", "1", "-d", str(roland_dir), "-e", "TRACK1=75"]
+        )
+        assert result.exit_code == 2
+        assert "SECTION:PARAM=VALUE" in result.output
+
 
 class TestNameCommand:
     def test_rename_memory(self, runner: CliRunner, roland_dir: Path) -> None:
@@ -202,6 +318,17 @@ class TestCopyCommand:
         assert result.exit_code == 0
         assert "Copied" in result.output
 
+    def test_copy_overwrite_assume_yes_env(
+        self, runner: CliRunner, roland_dir: Path
+    ) -> None:
+        result = runner.invoke(
+            cli, ["copy", "1", "2", "-d", str(roland_dir)],
+            env={"EASTLIGHT_ASSUME_YES": "1"},
+        )
+        assert result.exit_code == 0
+        assert "Overwrite?" not in result.output
+        assert "Copied" in result.output
+
     def test_copy_nonexistent_source(
         self, runner: CliRunner, roland_dir: Path
     ) -> None:
@@ -238,6 +365,20 @@ class TestSwapCommand:
         # Audio should move from 001_1 to 002_1
         assert (roland_dir / "WAVE" / "002_1" / "002_1.WAV").exists()
 
+    def test_swap_exchanges_audio_on_both_sides(
+        self, runner: CliRunner, roland_dir: Path
+    ) -> None:
+        wave = roland_dir / "WAVE"
+        (wave / "002_1").mkdir()
+        (wave / "002_1" / "002_1.WAV").write_bytes(b"\x02" * 44)
+        result = runner.invoke(cli, ["swap", "1", "2", "-d", str(roland_dir)])
+        assert result.exit_code == 0
+        assert (wave / "001_1" / "001_1.WAV").read_bytes() == b"\x02" * 44
+        assert (wave / "002_1" / "002_1.WAV").read_bytes() == b"\x00" * 44
+        assert sorted(p.name for p in wave.rglob("*")) == [
+            "001_1", "001_1.WAV", "002_1", "002_1.WAV"
+        ]
+
     def test_swap_nonexistent(self, runner: CliRunner, roland_dir: Path) -> None:
         result = runner.invoke(cli, ["swap", "1", "99", "-d", str(roland_dir)])
         assert result.exit_code != 0
@@ -252,12 +393,38 @@ class TestDiffCommand:
         assert result.exit_code == 0
         # NAME section will differ (same bytes since copy preserves name)
         # but other sections should be identical
+        assert "No differences found" in result.output
+
+    def test_diff_identical_skips_parse(self, runner: CliRunner, roland_dir: Path) -> None:
+        from eastlight.core.library import RC505Library
+
+        data = roland_dir / "DATA"
+        content = (data / "MEMORY001A.RC0").read_text(encoding="utf-8")
+        (data / "MEMORY003A.RC0").write_text(content.replace('id="0"', 'id="2"'), encoding="utf-8")
+        lib = RC505Library(roland_dir)
+        assert lib.memories_identical(1, 3)
+        assert lib.memories_identical(2, 2)
+        assert not lib.memories_identical(1, 2)
+
+        result = runner.invoke(cli, ["diff", "1", "3", "-d", str(roland_dir), "--json"])
+        data = json.loads(result.output)
+        assert data["a"]["name"] == data["b"]["name"] == "Memory 1"
+        assert data["sections"] == {}
 
     def test_diff_different(self, runner: CliRunner, roland_dir: Path) -> None:
         result = runner.invoke(cli, ["diff", "1", "2", "-d", str(roland_dir)])
         assert result.exit_code == 0
         assert "difference" in result.output.lower()
 
+    def test_diff_json(self, runner: CliRunner, roland_dir: Path) -> None:
+        result = runner.invoke(
+            cli, ["diff", "1", "2", "-d", str(roland_dir), "-s", "NAME", "--json"]
+        )
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        changed = {d["tag"]: (d["a"], d["b"]) for d in data["sections"]["NAME"]}
+        assert changed["A"] == (77, 76)
+
     def test_diff_section_filter(self, runner: CliRunner, roland_dir: Path) -> None:
         result = runner.invoke(
             cli, ["diff", "1", "2", "-d", str(roland_dir), "-s", "NAME"]
@@ -340,6 +507,18 @@ class TestWavInfoCommand:
         assert result.exit_code == 0
         assert "empty" in result.output
 
+    def test_wav_info_json(
+        self, runner: CliRunner, roland_dir_wav: Path
+    ) -> None:
+        result = runner.invoke(
+            cli, ["wav-info", "1", "-d", str(roland_dir_wav), "--json"]
+        )
+        assert result.exit_code == 0
+        tracks = json.loads(result.output)["tracks"]
+        assert tracks[0]["audio"] is True
+        assert tracks[0]["sample_rate"] == 44100
+        assert tracks[1] == {"track": 2, "audio": False}
+
     def test_wav_info_nonexistent_memory(
         self, runner: CliRunner, roland_dir_wav: Path
     ) -> None:
@@ -520,3 +699,108 @@ class TestWavImportCommand:
         track2 = rc0.mem["TRACK2"]
         assert track2["W"] == 1  # has_audio
         assert track2["X"] == frames  # total_samples
+        assert track2["V"] == 88200  # samples_per_measure at 120.0 BPM
+        assert track2["S"] == 1  # a quarter measure still counts as one
+
+    def test_import_measure_math_is_exact(
+        self, runner: CliRunner, roland_dir_wav: Path, tmp_path: Path
+    ) -> None:
+        # 172.8 BPM: 44100 * 60 / 172.8 * 4 is exactly 61250; float math gave 61249
+        runner.invoke(
+            cli, ["set", "1", "TRACK2", "tempo_x10", "1728", "-d", str(roland_dir_wav)]
+        )
+        src = tmp_path / "source.wav"
+        sf.write(str(src), np.zeros((61250 * 3, 2), dtype=np.float32), DEVICE_SAMPLE_RATE)
+
+        result = runner.invoke(
+            cli, ["wav-import", "1", "2", str(src), "-d", str(roland_dir_wav)]
+        )
+        assert result.exit_code == 0, result.output
+        track2 = parse_memory_file(roland_dir_wav / "DATA" / "MEMORY001A.RC0").mem["TRACK2"]
+        assert track2["V"] == 61250
+        assert track2["S"] == 3
+
+
+class TestBatchCommand:
+    def test_batch_runs_each_line(
+        self, runner: CliRunner, roland_dir: Path, tmp_path: Path
+    ) -> None:
+        script = tmp_path / "edits.txt"
+        script.write_text(
+            "# rename and re-pan\n"
+            f'name 1 "Batch" -d "{roland_dir}"\n'
+            "\n"
+            f"set 1 TRACK1 pan 75 -d \"{roland_dir}\"\n"
+        )
+        result = runner.invoke(cli, ["batch", str(script)])
+        assert result.exit_code == 0, result.output
+        rc0 = parse_memory_file(roland_dir / "DATA" / "MEMORY001A.RC0")
+        assert rc0.mem["TRACK1"]["C"] == 75
+        assert "Batch" in runner.invoke(cli, ["list", "-d", str(roland_dir)]).output
+
+    def test_batch_stops_at_first_failure(
+        self, runner: CliRunner, roland_dir: Path
+    ) -> None:
+        script = (
+            f'set 1 TRACK1 pan loud -d "{roland_dir}"\n'
+            f'set 1 TRACK1 pan 75 -d "{roland_dir}"\n'
+        )
+        result = runner.invoke(cli, ["batch", "-"], input=script)
+        assert result.exit_code != 0
+        assert "line 1:" in result.output
+        rc0 = parse_memory_file(roland_dir / "DATA" / "MEMORY001A.RC0")
+        assert rc0.mem["TRACK1"]["C"] == 50
+
+    def test_batch_keep_going(self, runner: CliRunner, roland_dir: Path) -> None:
+        script = (
+            f'set 1 TRACK1 pan loud -d "{roland_dir}"\n'
+            f'set 1 TRACK1 pan 75 -d "{roland_dir}"\n'
+        )
+        result = runner.invoke(cli, ["batch", "-k", "-"], input=script)
+        assert result.exit_code != 0
+        assert "1 command(s) failed" in result.output
+        rc0 = parse_memory_file(roland_dir / "DATA" / "MEMORY001A.RC0")
+        assert rc0.mem["TRACK1"]["C"] == 75
+
+    def test_batch_keep_going_past_missing_slot(
+        self, runner: CliRunner, roland_dir: Path
+    ) -> None:
+        script = (
+            f'show 50 -d "{roland_dir}"\n'
+            f'set 1 TRACK1 pan 75 -d "{roland_dir}"\n'
+        )
+        result = runner.invoke(cli, ["batch", "-k", "-"], input=script)
+        assert result.exit_code == 1
+        assert "Error: line 1:" in result.output
+        assert "1 command(s) failed" in result.output
+        rc0 = parse_memory_file(roland_dir / "DATA" / "MEMORY001A.RC0")
+        assert rc0.mem["TRACK1"]["C"] == 75
+
+    def test_repl_runs_until_quit(self, runner: CliRunner, roland_dir: Path) -> None:
+        result = runner.invoke(
+            cli, ["repl"], input=f'list -d "{roland_dir}"\nquit\nlist\n'
+        )
+        assert result.exit_code == 0
+        assert result.output.count("eastlight> ") == 2
+        assert "Loop 2" in result.output
+
+    def test_batch_resolves_dir_once(
+        self, runner: CliRunner, roland_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import eastlight.core.config as config
+        from eastlight.cli.main import _resolve_dir
+
+        calls = []
+
+        def counting_resolve(explicit: str | None = None) -> Path:
+            calls.append(explicit)
+            return roland_dir
+
+        monkeypatch.setattr(config, "resolve_roland_dir", counting_resolve)
+        _resolve_dir.cache_clear()
+        try:
+            result = runner.invoke(cli, ["batch", "-"], input="list\nlist\n")
+        finally:
+            _resolve_dir.cache_clear()
+        assert result.exit_code == 0, result.output
+        assert calls == [None]
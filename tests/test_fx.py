@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pytest
@@ -259,6 +260,13 @@ class TestFXTypeEnum:
         assert r.fx_types.ifx_index("lpf") == 0
         assert r.fx_types.ifx_index("Delay") == 35
 
+    def test_effect_name_by_chain(self) -> None:
+        r = SchemaRegistry()
+        r.load_all()
+        assert r.fx_types.effect_name("ifx", 35) == "DELAY"
+        assert r.fx_types.effect_name("tfx", 66) == "BEAT_SCATTER"
+        assert r.fx_types.effect_name("ifx", 66) == "UNKNOWN(66)"
+
 
 # --- FX CLI tests ---
 
@@ -312,6 +320,27 @@ class TestFXShowCommand:
         assert result.exit_code == 0
         assert "OFF" in result.output  # AB has sw=0
 
+    def test_fx_show_missing_section(self, runner: CliRunner, fx_roland_dir: Path) -> None:
+        path = fx_roland_dir / "DATA" / "MEMORY001A.RC0"
+        content = path.read_text(encoding="utf-8")
+        start, end = content.index("<AB_LPF>"), content.index("</AB_LPF>\n") + 10
+        path.write_text(content[:start] + content[end:], encoding="utf-8")
+        result = runner.invoke(
+            cli, ["fx-show", "1", "ifx", "-d", str(fx_roland_dir), "-s", "AB"]
+        )
+        assert result.exit_code == 0
+        assert "(no section 'AB_LPF')" in result.output
+
+    def test_fx_show_json(self, runner: CliRunner, fx_roland_dir: Path) -> None:
+        result = runner.invoke(
+            cli, ["fx-show", "1", "ifx", "-d", str(fx_roland_dir), "-g", "A", "--json"]
+        )
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        aa = data["subslots"][0]
+        assert (aa["subslot"], aa["on"], aa["fx"]) == ("AA", True, "DELAY")
+        assert aa["parameters"]
+
 
 class TestFXSetCommand:
     def test_fx_set_effect_param_by_name(
@@ -384,6 +413,42 @@ class TestFXSetCommand:
         assert result.exit_code != 0
         assert "not found" in result.output
 
+    def test_fx_set_many_writes_all_edits(
+        self, runner: CliRunner, fx_roland_dir: Path
+    ) -> None:
+        result = runner.invoke(cli, [
+            "fx-set-many", "1", "-d", str(fx_roland_dir),
+            "-e", "ifx:AB:sw=1", "-e", "ifx:AA:feedback=30",
+        ])
+        assert result.exit_code == 0
+        assert result.output.count("Set") == 2
+
+        rc0 = parse_memory_file(fx_roland_dir / "DATA" / "MEMORY001A.RC0")
+        assert rc0.ifx.sections["AB"]["A"] == 1
+        assert rc0.ifx.sections["AA_DELAY"]["B"] == 30
+
+    def test_fx_set_many_failure_writes_nothing(
+        self, runner: CliRunner, fx_roland_dir: Path
+    ) -> None:
+        path = fx_roland_dir / "DATA" / "MEMORY001A.RC0"
+        before = path.read_bytes()
+        result = runner.invoke(cli, [
+            "fx-set-many", "1", "-d", str(fx_roland_dir),
+            "-e", "ifx:AB:sw=1", "-e", "ifx:AA:nonexistent=30",
+        ])
+        assert result.exit_code != 0
+        assert "not found" in result.output
+        assert path.read_bytes() == before
+
+    def test_fx_set_many_bad_spec(
+        self, runner: CliRunner, fx_roland_dir: Path
+    ) -> None:
+        result = runner.invoke(
+            cli, ["fx-set-many", "1", "-d", str(fx_roland_dir), "-e", "ifx:AA:feedback"]
+        )
+        assert result.exit_code == 2
+        assert "CHAIN:SUBSLOT:PARAM=VALUE" in result.output
+
 
 class TestFXShowWithResolvedSchemas:
     """Verify that FX effect parameters are resolved via suffix matching."""
@@ -85,6 +85,18 @@ class TestMemory:
         assert "MASTER" in names
         assert "SETUP" in names  # from ifx/tfx
 
+    def test_sections_resolved_on_first_access(
+        self, sample_rc0_path: Path, registry: SchemaRegistry
+    ) -> None:
+        rc0 = parse_memory_file(sample_rc0_path)
+        mem = Memory(rc0, registry)
+        assert mem._resolved == {}
+        setup = mem.section("SETUP")
+        assert setup is mem.section("SETUP")
+        assert setup.raw is rc0.tfx["SETUP"]  # later element wins, as before
+        assert mem.section("NOPE") is None
+        assert list(mem._resolved) == ["SETUP"]
+
     def test_master_schema_resolution(self, sample_rc0_path: Path, registry: SchemaRegistry) -> None:
         rc0 = parse_memory_file(sample_rc0_path)
         mem = Memory(rc0, registry)
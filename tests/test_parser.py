@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from eastlight.core.parser import parse_memory_file, parse_rc0
+from eastlight.core.parser import parse_memory_file, parse_rc0, parse_sections
 
 
 class TestParseRC0:
@@ -108,6 +108,53 @@ class TestParseMemoryFile:
             parse_memory_file(path)
 
 
+class TestFilteredParse:
+    def test_only_sections(self, sample_rc0_path: Path) -> None:
+        rc0 = parse_memory_file(sample_rc0_path, only_sections={"NAME", "TRACK2"})
+        assert rc0.mem.section_names == ["NAME", "TRACK2"]
+        assert rc0.mem["TRACK2"]["U"] == 1200
+        # Scanning stops once both sections are found
+        assert rc0.ifx is None
+        assert rc0.tfx is None
+
+    def test_only_tags(self, sample_rc0_path: Path) -> None:
+        rc0 = parse_memory_file(sample_rc0_path, only_sections={"TRACK1"}, only_tags={"U", "W"})
+        assert rc0.mem["TRACK1"].fields == {"U": 700, "W": 1}
+
+    def test_only_tags_does_not_match_longer_tags(self) -> None:
+        body = "<A>1</A>\n<AB>2</AB>\n<B>3</B>"
+        sections = parse_sections(f"<SEC>\n{body}\n</SEC>", only_tags={"A", "B"})
+        assert sections["SEC"].fields == {"A": 1, "B": 3}
+        assert parse_sections(f"<SEC>\n{body}\n</SEC>", only_tags=set())["SEC"].fields == {}
+
+    def test_parse_sections_group_and_unclosed(self) -> None:
+        body = "<A>\n\t<A>1</A>\n\t<B>-2</B>\n</A>\n<OPEN>\n\t<A>3</A>"
+        sections = parse_sections(body)
+        assert sections["A"].fields == {"A": 1, "B": -2}
+        assert "OPEN" not in sections  # no closing line, as with the old regex
+
+    def test_missing_section_is_skipped(self, sample_rc0_path: Path) -> None:
+        rc0 = parse_memory_file(sample_rc0_path, only_sections={"NAME", "TRACK5"})
+        assert rc0.mem.section_names == ["NAME"]
+        # The other elements are still scanned for the missing section
+        assert rc0.tfx is not None
+        assert rc0.tfx.section_names == []
+
+    def test_matches_full_parse(self, sample_rc0_path: Path) -> None:
+        full = parse_memory_file(sample_rc0_path)
+        partial = parse_memory_file(sample_rc0_path, only_sections={"MASTER"})
+        assert partial.mem["MASTER"].fields == full.mem["MASTER"].fields
+        assert (partial.device_name, partial.revision, partial.count) == (
+            full.device_name, full.revision, full.count
+        )
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "EMPTY.RC0"
+        path.write_bytes(b"")
+        with pytest.raises(ValueError, match="No <database> header"):
+            parse_memory_file(path, only_sections={"NAME"})
+
+
 class TestParseRealFiles:
     """Tests against real device dump files (skipped if not available)."""
 
@@ -9,7 +9,7 @@ import yaml
 from click.testing import CliRunner
 
 from eastlight.cli.main import cli, _parse_memory_range
-from eastlight.core.library import RC505Library
+from eastlight.core.library import RC505Library, _prefetch_summary_pages
 from eastlight.core.parser import parse_memory_file
 
 
@@ -90,6 +90,46 @@ class TestClearMemory:
         lib.clear_memory(50)  # no files for slot 50
 
 
+# --- Library: memory summaries ---
+
+
+class TestMemorySummary:
+    def test_list_memories_summary(self, roland_dir: Path) -> None:
+        lib = RC505Library(roland_dir)
+        summaries = lib.list_memories_summary()
+        assert [s.number for s in summaries] == [1, 2]
+
+        first = summaries[0]
+        assert first.name == "Memory 1"
+        assert first.track_flags == (True, False, False, False, False)
+        assert first.tempo_x10 == 700
+        assert first.has_backup is True
+        assert summaries[1].has_backup is False
+
+    def test_list_memories_summary_threaded(self, roland_dir: Path) -> None:
+        lib = RC505Library(roland_dir)
+        assert lib.list_memories_summary(workers=4) == lib.list_memories_summary()
+
+    def test_prefetch_tolerates_missing_and_empty_files(self, tmp_path: Path) -> None:
+        empty = tmp_path / "EMPTY.RC0"
+        empty.write_bytes(b"")
+        _prefetch_summary_pages([tmp_path / "MISSING.RC0", empty])
+
+    def test_list_memories_matches_memory_slot(self, roland_dir: Path) -> None:
+        lib = RC505Library(roland_dir)
+        assert lib.list_memories() == [lib.memory_slot(n) for n in range(1, 100)]
+
+    def test_memory_name_cache_invalidated_on_save(self, roland_dir: Path) -> None:
+        lib = RC505Library(roland_dir, backup=False)
+        assert lib.memory_name(1) == "Memory 1"
+
+        rc0 = lib.parse_memory(1)
+        for tag, ch in zip("ABCDEFGHIJKL", "Renamed     ", strict=True):
+            rc0.mem["NAME"][tag] = ord(ch)
+        lib.save_memory(1, rc0)
+        assert lib.memory_name(1) == "Renamed"
+
+
 # --- Library: backup management ---
 
 
@@ -134,6 +174,24 @@ class TestBackupManagement:
         # Should have original content back
         assert (roland_dir / "DATA" / "MEMORY001A.RC0").read_text() == original
 
+    def test_restore_backup_refreshes_names(self, roland_dir: Path, tmp_path: Path) -> None:
+        import os
+
+        plain = RC505Library(roland_dir, backup=False)
+        plain.save_memory(1, plain.parse_memory(1))  # normalize to writer format
+        lib = RC505Library(roland_dir, backup=True, backup_dir=tmp_path / "backups")
+        path = roland_dir / "DATA" / "MEMORY001A.RC0"
+        old_mtime = path.stat().st_mtime_ns
+        rc0 = lib.parse_memory(1)
+        rc0.mem["NAME"]["A"] = ord("N")  # same size, different name
+        lib.save_memory(1, rc0)
+        # Coarse (FAT) timestamps: the new file ends up with the old mtime
+        os.utime(path, ns=(old_mtime, old_mtime))
+        assert lib.memory_name(1) == "Nemory 1"
+
+        lib.restore_backup(lib.list_backups()[0][0])
+        assert lib.memory_name(1) == "Memory 1"
+
     def test_restore_nonexistent(self, roland_dir: Path, tmp_path: Path) -> None:
         backup_dir = tmp_path / "backups"
         lib = RC505Library(roland_dir, backup=True, backup_dir=backup_dir)
@@ -159,6 +217,7 @@ class TestBackupManagement:
         assert deleted == 2
         remaining = lib.list_backups()
         assert len(remaining) == 1
+        assert remaining[0][0] == "20260103T000000Z"
 
     def test_prune_nothing_to_delete(self, roland_dir: Path, tmp_path: Path) -> None:
         backup_dir = tmp_path / "backups"
@@ -337,6 +396,22 @@ class TestTemplateApply:
         assert result.exit_code == 0
         assert "Warning" in result.output  # warns about missing slots
 
+    def test_apply_template_skips_unchanged(
+        self, runner: CliRunner, roland_dir: Path, tmp_path: Path
+    ) -> None:
+        tmpl = tmp_path / "t.yaml"
+        runner.invoke(
+            cli, ["template-export", "1", str(tmpl), "-d", str(roland_dir)]
+        )
+        path = roland_dir / "DATA" / "MEMORY001A.RC0"
+        before = path.stat().st_ino
+        result = runner.invoke(
+            cli, ["template-apply", str(tmpl), "1", "-d", str(roland_dir)]
+        )
+        assert result.exit_code == 0
+        assert "to 0 memory slot(s) (1 already matched)" in result.output
+        assert path.stat().st_ino == before  # not rewritten
+
 
 # --- CLI: bulk-set command ---
 
@@ -370,6 +445,35 @@ class TestBulkSet:
         assert result.exit_code == 0
         assert "1 memory slot" in result.output
 
+    def test_bulk_set_skips_unchanged(self, runner: CliRunner, roland_dir: Path) -> None:
+        runner.invoke(
+            cli, ["bulk-set", "1", "MASTER", "A", "70", "-d", str(roland_dir)]
+        )
+        result = runner.invoke(
+            cli, ["bulk-set", "1-2", "MASTER", "A", "70", "-d", str(roland_dir)]
+        )
+        assert result.exit_code == 0
+        assert "across 1 memory slot(s) (1 already matched)" in result.output
+
+    def test_bulk_set_section_in_ifx_and_tfx(self, runner: CliRunner, roland_dir: Path) -> None:
+        # SETUP exists in both <ifx> and <tfx>; the later element wins, as in `set`
+        result = runner.invoke(
+            cli, ["bulk-set", "1", "SETUP", "A", "1", "-d", str(roland_dir)]
+        )
+        assert result.exit_code == 0
+        rc0 = parse_memory_file(roland_dir / "DATA" / "MEMORY001A.RC0")
+        assert rc0.tfx["SETUP"]["A"] == 1
+        assert rc0.ifx["SETUP"]["A"] == 0
+
+    def test_bulk_set_unknown_param(self, runner: CliRunner, roland_dir: Path) -> None:
+        before = (roland_dir / "DATA" / "MEMORY001A.RC0").read_bytes()
+        result = runner.invoke(
+            cli, ["bulk-set", "1-2", "MASTER", "zzz_fake", "1", "-d", str(roland_dir)]
+        )
+        assert result.exit_code != 0
+        assert "not found" in result.output
+        assert (roland_dir / "DATA" / "MEMORY001A.RC0").read_bytes() == before
+
 
 # --- Validation warnings ---
 
@@ -8,6 +8,7 @@ import pytest
 from click.testing import CliRunner
 
 from eastlight.cli.main import cli
+from eastlight.core import config as config_mod
 from eastlight.core.config import (
     Config,
     _is_roland_dir,
@@ -61,6 +62,30 @@ class TestAutoBackup:
         assert backup_file.exists()
         assert backup_file.read_text() == original_content
 
+    def test_unchanged_file_is_linked_not_copied(
+        self, tmp_path: Path, sample_rc0_content: str
+    ) -> None:
+        root = tmp_path / "ROLAND"
+        data = root / "DATA"
+        (root / "WAVE").mkdir(parents=True)
+        data.mkdir(parents=True)
+        rc0_path = data / "MEMORY001A.RC0"
+        rc0_path.write_text(sample_rc0_content, encoding="utf-8")
+
+        backup_dir = tmp_path / "backups"
+        lib = RC505Library(root, backup=True, backup_dir=backup_dir)
+        first = backup_dir / "20240101T000000Z" / "DATA" / "MEMORY001A.RC0"
+        first.parent.mkdir(parents=True)
+        first.write_text(sample_rc0_content, encoding="utf-8")
+
+        second = lib._backup_file(rc0_path)
+        assert second is not None and second != first
+        assert second.stat().st_ino == first.stat().st_ino
+
+        rc0_path.write_text(sample_rc0_content + "\n", encoding="utf-8")
+        lib._backup_file(rc0_path)  # same snapshot second: keeps earlier state
+        assert second.read_text() == sample_rc0_content
+
     def test_backup_disabled(
         self, tmp_path: Path, sample_rc0_content: str
     ) -> None:
@@ -153,6 +178,18 @@ class TestConfig:
         assert loaded.roland_dir is None
         assert loaded.backup is True
 
+    def test_load_config_cache(self, tmp_path: Path) -> None:
+        path = tmp_path / "config.yaml"
+        save_config(Config(recent=["/a"]), path)
+        first = load_config(path)
+        first.recent.append("/b")
+        assert load_config(path).recent == ["/a"]  # callers get copies
+
+        path.write_text("roland_dir: /mnt/sd/ROLAND\nbackup: false\n")
+        reloaded = load_config(path)
+        assert reloaded.roland_dir == "/mnt/sd/ROLAND"
+        assert reloaded.backup is False
+
 
 # --- Device detection tests ---
 
@@ -180,6 +217,44 @@ class TestDeviceDetection:
         result = detect_device()
         assert isinstance(result, list)
 
+    def test_detect_cache_rechecks_devices(
+        self, tmp_path: Path, sample_rc0_content: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        volume = tmp_path / "media" / "SDCARD"
+        data = volume / "ROLAND" / "DATA"
+        data.mkdir(parents=True)
+        (data / "MEMORY001A.RC0").write_text(sample_rc0_content)
+
+        monkeypatch.setattr(config_mod, "_DETECT_CACHE_FILE", tmp_path / "detected.json")
+        monkeypatch.setattr(config_mod, "_scan_roots", lambda: [(str(volume.parent), 2)])
+
+        assert detect_device() == [volume / "ROLAND"]
+        assert (tmp_path / "detected.json").exists()
+        assert detect_device() == [volume / "ROLAND"]  # served from cache
+
+        # A stale cached device is not returned
+        (data / "MEMORY001A.RC0").unlink()
+        assert detect_device() == []
+
+    def test_detect_scans_several_roots_in_order(
+        self, tmp_path: Path, sample_rc0_content: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        roots = []
+        for name in ("sdb", "sdc", "sdd"):
+            data = tmp_path / name / "CARD" / "ROLAND" / "DATA"
+            data.mkdir(parents=True)
+            (data / "MEMORY001A.RC0").write_text(sample_rc0_content)
+            roots.append((str(tmp_path / name), 2))
+        (tmp_path / "empty").mkdir()
+        roots.insert(1, (str(tmp_path / "empty"), 2))
+
+        monkeypatch.setattr(config_mod, "_DETECT_CACHE_FILE", tmp_path / "detected.json")
+        monkeypatch.setattr(config_mod, "_scan_roots", lambda: roots)
+
+        assert detect_device() == [
+            tmp_path / name / "CARD" / "ROLAND" for name in ("sdb", "sdc", "sdd")
+        ]
+
 
 # --- Dir resolution tests ---
 
@@ -197,6 +272,12 @@ class TestResolveRolandDir:
         with pytest.raises(ValueError, match="not found"):
             resolve_roland_dir("/nonexistent/path")
 
+    def test_explicit_path_is_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.txt"
+        path.write_text("x")
+        with pytest.raises(ValueError, match="not found"):
+            resolve_roland_dir(str(path))
+
     def test_config_fallback(self, tmp_path: Path, sample_rc0_content: str) -> None:
         root = tmp_path / "ROLAND"
         data = root / "DATA"
@@ -209,6 +290,14 @@ class TestResolveRolandDir:
         result = resolve_roland_dir(config_path=cfg_path)
         assert result == root
 
+    def test_config_path_not_a_directory(self, tmp_path: Path) -> None:
+        stale = tmp_path / "ROLAND"
+        stale.write_text("x")
+        cfg_path = tmp_path / "config.yaml"
+        save_config(Config(roland_dir=str(stale)), cfg_path)
+        with pytest.raises(ValueError, match="No ROLAND"):
+            resolve_roland_dir(config_path=cfg_path)
+
     def test_no_dir_raises(self, tmp_path: Path) -> None:
         cfg_path = tmp_path / "config.yaml"
         save_config(Config(), cfg_path)
@@ -235,6 +324,11 @@ class TestConfigCommand:
         assert result.exit_code == 0
         assert "Saved" in result.output
 
+    def test_config_set_dir_missing(self, runner: CliRunner, tmp_path: Path) -> None:
+        result = runner.invoke(cli, ["config", "--set-dir", str(tmp_path / "nope")])
+        assert result.exit_code == 2
+        assert "does not exist" in result.output
+
 
 class TestDetectCommand:
     def test_detect_runs(self, runner: CliRunner) -> None:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from eastlight.core.schema import SchemaRegistry, load_schema_from_yaml
+from eastlight.core.schema import SchemaRegistry, load_cached_registry, load_schema_from_yaml
 
 
 class TestLoadSchema:
@@ -31,9 +31,28 @@ class TestLoadSchema:
         assert schema.name_to_tag("pan") == "C"
         assert schema.name_to_tag("tempo_x10") == "U"
         assert schema.name_to_tag("nonexistent") is None
+        assert schema.by_name["pan"] == ("C", schema.fields["C"])
+
+    def test_display_names(self) -> None:
+        schema_dir = Path(__file__).parent.parent / "src" / "eastlight" / "schema"
+        schema = load_schema_from_yaml(schema_dir / "track.yaml")
+        labels = schema.display_names
+        assert labels.keys() == schema.fields.keys()
+        for tag, fd in schema.fields.items():
+            assert labels[tag] == (fd.display or fd.name)
+        assert schema.display_names is labels  # built once
 
 
 class TestSchemaRegistry:
+    def test_get_misses_are_forgotten_on_register(self) -> None:
+        schema_dir = Path(__file__).parent.parent / "src" / "eastlight" / "schema"
+        registry = SchemaRegistry()
+        assert registry.get("TRACK1") is None  # memoized miss
+
+        schema = load_schema_from_yaml(schema_dir / "track.yaml")
+        registry.register(schema)
+        assert registry.get("TRACK1") is schema
+
     def test_register_and_get(self) -> None:
         schema_dir = Path(__file__).parent.parent / "src" / "eastlight" / "schema"
         registry = SchemaRegistry()
@@ -126,3 +145,27 @@ class TestSchemaRegistry:
         assert "C" in schema.fields
         assert schema.fields["A"].name == "rx_ch"
         assert schema.fields["C"].name == "tx_ch"
+
+
+class TestCachedRegistry:
+    def test_builds_and_writes_cache(self, tmp_path: Path) -> None:
+        registry = load_cached_registry(tmp_path)
+        assert registry.get("TRACK1") is not None
+        assert registry.fx_types.ifx_name(0) is not None
+        assert len(list(tmp_path.glob("registry-*.pkl"))) == 1
+
+    def test_reuses_cache(self, tmp_path: Path) -> None:
+        first = load_cached_registry(tmp_path)
+        second = load_cached_registry(tmp_path)
+        assert second is not first  # unpickled copy
+        assert second.section_types == first.section_types
+        assert second.fx_effect_names == first.fx_effect_names
+        assert second.get("AA_LPF").fields.keys() == first.get("AA_LPF").fields.keys()
+
+    def test_corrupt_cache_is_rebuilt(self, tmp_path: Path) -> None:
+        load_cached_registry(tmp_path)
+        cache_file = next(tmp_path.glob("registry-*.pkl"))
+        cache_file.write_bytes(b"not a pickle")
+        registry = load_cached_registry(tmp_path)
+        assert registry.get("MASTER") is not None
+        assert cache_file.read_bytes() != b"not a pickle"
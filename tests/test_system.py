@@ -260,6 +260,18 @@ class TestSysSetCommand:
         rc0 = parse_system_file(sys_roland_dir / "DATA" / "SYSTEM1.RC0")
         assert rc0.sys["SETUP"]["D"] == 9
 
+    def test_sys_set_lowercase_section(
+        self, runner: CliRunner, sys_roland_dir: Path
+    ) -> None:
+        result = runner.invoke(
+            cli, ["sys-set", "setup", "D", "7", "-d", str(sys_roland_dir)]
+        )
+        assert result.exit_code == 0
+        assert "SETUP" in result.output
+
+        rc0 = parse_system_file(sys_roland_dir / "DATA" / "SYSTEM1.RC0")
+        assert rc0.sys["SETUP"]["D"] == 7
+
     def test_sys_set_pref(self, runner: CliRunner, sys_roland_dir: Path) -> None:
         result = runner.invoke(
             cli, ["sys-set", "PREF", "pref_eq", "0", "-d", str(sys_roland_dir)]
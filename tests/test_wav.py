@@ -14,7 +14,9 @@ from eastlight.core.wav import (
     DEVICE_SUBTYPE,
     ExportFormat,
     import_audio,
+    stream_import_audio,
     wav_export,
+    wav_export_file,
     wav_info,
     wav_overview,
     wav_read,
@@ -58,6 +60,12 @@ class TestWavInfo:
         assert info.channels == 1
         assert not info.is_float32
 
+    def test_cache_invalidated_on_rewrite(self, device_wav: Path) -> None:
+        assert wav_info(device_wav) is wav_info(device_wav)
+        data = np.zeros((100, 2), dtype=np.float32)
+        sf.write(str(device_wav), data, DEVICE_SAMPLE_RATE, subtype=DEVICE_SUBTYPE)
+        assert wav_info(device_wav).frames == 100
+
 
 class TestWavRead:
     def test_reads_float32(self, device_wav: Path) -> None:
@@ -102,6 +110,17 @@ class TestWavExport:
         info = wav_info(path)
         assert info.subtype == "PCM_16"
 
+    def test_export_file_native_is_byte_copy(self, device_wav: Path, tmp_path: Path) -> None:
+        out = tmp_path / "copy.wav"
+        wav_export_file(device_wav, out, ExportFormat.FLOAT_32)
+        assert out.read_bytes() == device_wav.read_bytes()
+
+    def test_export_file_converts_subtype(self, device_wav: Path, tmp_path: Path) -> None:
+        out = tmp_path / "pcm.wav"
+        wav_export_file(device_wav, out, ExportFormat.PCM_24)
+        assert wav_info(out).subtype == "PCM_24"
+        assert wav_info(out).frames == 44100
+
 
 class TestImportAudio:
     def test_import_stereo(self, device_wav: Path) -> None:
@@ -115,6 +134,8 @@ class TestImportAudio:
         assert data.shape[1] == 2
         # Both channels should be identical (duplicated mono)
         np.testing.assert_array_equal(data[:, 0], data[:, 1])
+        assert data.dtype == np.float32
+        assert data.flags.c_contiguous
 
     def test_multi_channel_truncated(self, tmp_path: Path) -> None:
         """Multi-channel (>2) input should be truncated to first 2 channels."""
@@ -125,10 +146,31 @@ class TestImportAudio:
 
         imported, _ = import_audio(path)
         assert imported.shape[1] == 2
+        assert imported.flags.c_contiguous
         # Channel 3 should be discarded
         assert imported[:, 0].max() == 0.0
 
 
+class TestStreamImportAudio:
+    def test_matches_import_audio(self, mono_wav: Path, tmp_path: Path) -> None:
+        dst = tmp_path / "001_1" / "001_1.WAV"
+        frames = stream_import_audio(mono_wav, dst, blocksize=1000)
+        assert frames == 22050
+        data, sr = wav_read(dst)
+        expected, _ = import_audio(mono_wav)
+        np.testing.assert_array_equal(data, expected)
+        assert wav_info(dst).subtype == DEVICE_SUBTYPE
+        assert not list(dst.parent.glob("*.tmp"))
+
+    def test_rejects_wrong_sample_rate(self, tmp_path: Path) -> None:
+        src = tmp_path / "48k.wav"
+        sf.write(str(src), np.zeros((100, 2), dtype=np.float32), 48000)
+        dst = tmp_path / "out" / "001_1.WAV"
+        with pytest.raises(ValueError, match="Sample rate mismatch"):
+            stream_import_audio(src, dst)
+        assert not dst.parent.exists()
+
+
 class TestWavOverview:
     def test_overview_shape(self, device_wav: Path) -> None:
         overview = wav_overview(device_wav, num_points=100)
@@ -20,6 +20,17 @@ class TestWriteRC0:
         assert rc0_back.device_name == rc0.device_name
         assert rc0_back.count == rc0.count
 
+    def test_write_replaces_file_atomically(
+        self, sample_rc0_path: Path, tmp_path: Path
+    ) -> None:
+        """Overwriting leaves the exact serialized bytes and no temp file."""
+        rc0 = parse_memory_file(sample_rc0_path)
+        out_path = tmp_path / "output.RC0"
+        out_path.write_text("stale", encoding="utf-8")
+        content = write_rc0(rc0, out_path)
+        assert out_path.read_bytes() == content.encode("utf-8")
+        assert not list(tmp_path.glob("*.tmp"))
+
     def test_roundtrip_preserves_all_fields(self, sample_rc0_path: Path) -> None:
         """parse → write → parse must produce identical field values."""
         rc0 = parse_rc0(sample_rc0_path)